@@ -0,0 +1,34 @@
+"""002 — GIN (jsonb_path_ops) indexes on sources.parse_rules, raw_items.metadata,
+update_events.what_changed.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports @> containment but is smaller and faster
+    # than the default jsonb_ops, which is all we query these columns with.
+    op.create_index("idx_sources_parse_rules_gin", "sources", ["parse_rules"],
+                    postgresql_using="gin",
+                    postgresql_ops={"parse_rules": "jsonb_path_ops"})
+    op.create_index("idx_raw_items_metadata_gin", "raw_items", ["metadata"],
+                    postgresql_using="gin",
+                    postgresql_ops={"metadata": "jsonb_path_ops"})
+    op.create_index("idx_events_what_changed_gin", "update_events", ["what_changed"],
+                    postgresql_using="gin",
+                    postgresql_ops={"what_changed": "jsonb_path_ops"})
+
+
+def downgrade() -> None:
+    op.drop_index("idx_events_what_changed_gin", table_name="update_events")
+    op.drop_index("idx_raw_items_metadata_gin", table_name="raw_items")
+    op.drop_index("idx_sources_parse_rules_gin", table_name="sources")
@@ -0,0 +1,35 @@
+"""003 — Partial indexes on sources for the enabled-only scheduler scans.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A leading boolean column wastes the index on the huge enabled=true
+    # prefix; filter on it instead and key on the range-scanned timestamp.
+    op.drop_index("idx_sources_next_fetch", table_name="sources")
+    op.create_index("idx_sources_next_fetch", "sources", ["last_fetched_at"],
+                    postgresql_where=sa.text("enabled"))
+
+    op.drop_index("idx_sources_enabled", table_name="sources")
+    op.create_index("idx_sources_enabled", "sources", ["health_status"],
+                    postgresql_where=sa.text("enabled"))
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sources_enabled", table_name="sources")
+    op.create_index("idx_sources_enabled", "sources", ["enabled", "health_status"])
+
+    op.drop_index("idx_sources_next_fetch", table_name="sources")
+    op.create_index("idx_sources_next_fetch", "sources",
+                    ["enabled", "last_fetched_at", "poll_frequency_min"])
@@ -0,0 +1,29 @@
+"""004 — Make idx_sources_next_fetch a covering index for index-only scans.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Scheduler wake-ups only read these columns, so carrying them in the
+    # leaf pages lets Postgres skip the heap (and its JSONB payload) entirely.
+    op.drop_index("idx_sources_next_fetch", table_name="sources")
+    op.create_index("idx_sources_next_fetch", "sources", ["last_fetched_at"],
+                    postgresql_include=["source_id", "poll_frequency_min", "fetch_method"],
+                    postgresql_where=sa.text("enabled"))
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sources_next_fetch", table_name="sources")
+    op.create_index("idx_sources_next_fetch", "sources", ["last_fetched_at"],
+                    postgresql_where=sa.text("enabled"))
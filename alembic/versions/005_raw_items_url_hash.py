@@ -0,0 +1,26 @@
+"""005 — Replace the B-tree on raw_items.url with a hash index.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # URLs are only ever matched by equality; a hash index stores a fixed
+    # 4-byte hash code per row instead of the full (often very long) URL.
+    op.drop_index("idx_raw_items_url", table_name="raw_items")
+    op.create_index("idx_raw_items_url_hash", "raw_items", ["url"],
+                    postgresql_using="hash")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_raw_items_url_hash", table_name="raw_items")
+    op.create_index("idx_raw_items_url", "raw_items", ["url"])
@@ -0,0 +1,158 @@
+"""006 — Range-partition update_events by created_at month.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+update_events is append-only time-series data, so monthly partitions keep
+per-partition indexes small and let range filters on created_at prune to a
+single partition.  raw_items stays unpartitioned: it is the target of
+update_events.raw_item_id and its (source_id, external_id) unique key would
+have to include the partition column.
+
+``ensure_update_events_partition(date)`` creates the partition for the
+month containing the given date; the scheduler calls it to pre-create the
+next month ahead of time.  A DEFAULT partition catches anything else.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    "event_id", "cluster_id", "source_id", "raw_item_id", "company_slug",
+    "company_name", "product_line", "title", "categories", "trust_tier",
+    "severity", "breaking_change", "impact_score", "confidence", "what_changed",
+    "why_it_matters", "action_items", "citations", "evidence_snippets",
+    "summary_short", "summary_medium", "published_at", "created_at",
+    "digest_id", "digest_section",
+)
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False,
+                  server_default=sa.text("gen_random_uuid()")),
+        sa.Column("cluster_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("clusters.cluster_id"), nullable=True),
+        sa.Column("source_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("sources.source_id"), nullable=False),
+        sa.Column("raw_item_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("raw_items.raw_item_id"), nullable=False),
+        sa.Column("company_slug", sa.String(128), nullable=False),
+        sa.Column("company_name", sa.String(256), nullable=False),
+        sa.Column("product_line", sa.String(256), nullable=True),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("categories", postgresql.ARRAY(sa.Text()), nullable=False,
+                  server_default="{}"),
+        sa.Column("trust_tier", sa.SmallInteger(), nullable=False),
+        sa.Column("severity", sa.String(8), nullable=False, server_default="LOW"),
+        sa.Column("breaking_change", sa.Boolean(), nullable=False, server_default="false"),
+        sa.Column("impact_score", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("confidence", sa.String(16), nullable=False, server_default="confirmed"),
+        sa.Column("what_changed", postgresql.JSONB(), nullable=True),
+        sa.Column("why_it_matters", sa.Text(), nullable=True),
+        sa.Column("action_items", postgresql.ARRAY(sa.Text()), nullable=True),
+        sa.Column("citations", postgresql.ARRAY(sa.Text()), nullable=False,
+                  server_default="{}"),
+        sa.Column("evidence_snippets", postgresql.ARRAY(sa.Text()), nullable=True),
+        sa.Column("summary_short", sa.Text(), nullable=True),
+        sa.Column("summary_medium", sa.Text(), nullable=True),
+        sa.Column("published_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False,
+                  server_default=sa.text("now()")),
+        sa.Column("digest_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("digests.digest_id"), nullable=True),
+        sa.Column("digest_section", sa.String(32), nullable=True),
+    ]
+
+
+def _create_indexes() -> None:
+    op.create_index("idx_events_company", "update_events", ["company_slug", "created_at"])
+    op.create_index("idx_events_score", "update_events", ["impact_score"])
+    op.create_index("idx_events_created", "update_events", ["created_at"])
+    op.create_index("idx_events_digest", "update_events", ["digest_id"])
+    op.create_index("idx_events_severity", "update_events", ["severity", "created_at"])
+    op.create_index("idx_events_what_changed_gin", "update_events", ["what_changed"],
+                    postgresql_using="gin",
+                    postgresql_ops={"what_changed": "jsonb_path_ops"})
+
+
+def _drop_indexes(table: str) -> None:
+    for name in (
+        "idx_events_company", "idx_events_score", "idx_events_created",
+        "idx_events_digest", "idx_events_severity", "idx_events_what_changed_gin",
+    ):
+        op.drop_index(name, table_name=table)
+
+
+def _copy_rows(src: str, dst: str) -> None:
+    cols = ", ".join(_COLUMNS)
+    op.execute(f"INSERT INTO {dst} ({cols}) SELECT {cols} FROM {src}")
+
+
+def upgrade() -> None:
+    op.rename_table("update_events", "update_events_old")
+    op.execute("ALTER INDEX update_events_pkey RENAME TO update_events_old_pkey")
+    _drop_indexes("update_events_old")
+
+    # The partition key must be part of every unique constraint.
+    op.create_table(
+        "update_events",
+        *_columns(),
+        sa.PrimaryKeyConstraint("event_id", "created_at", name="update_events_pkey"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_update_events_partition(month_of date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            start_d date := date_trunc('month', month_of)::date;
+            end_d date := (date_trunc('month', month_of) + interval '1 month')::date;
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF update_events '
+                'FOR VALUES FROM (%L) TO (%L)',
+                'update_events_' || to_char(start_d, 'YYYY_MM'), start_d, end_d
+            );
+        END
+        $$
+    """)
+    # One partition per month of existing data, through next month
+    op.execute("""
+        SELECT ensure_update_events_partition(m::date)
+        FROM generate_series(
+            date_trunc('month', coalesce((SELECT min(created_at) FROM update_events_old), now())),
+            date_trunc('month', now()) + interval '1 month',
+            interval '1 month'
+        ) AS m
+    """)
+    op.execute("CREATE TABLE update_events_default PARTITION OF update_events DEFAULT")
+
+    _create_indexes()
+    _copy_rows("update_events_old", "update_events")
+    op.drop_table("update_events_old")
+
+
+def downgrade() -> None:
+    op.rename_table("update_events", "update_events_partitioned")
+    op.execute("ALTER INDEX update_events_pkey RENAME TO update_events_partitioned_pkey")
+    _drop_indexes("update_events_partitioned")
+
+    op.create_table(
+        "update_events",
+        *_columns(),
+        sa.PrimaryKeyConstraint("event_id", name="update_events_pkey"),
+    )
+    _create_indexes()
+    _copy_rows("update_events_partitioned", "update_events")
+
+    # Dropping the parent drops every partition with it
+    op.drop_table("update_events_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS ensure_update_events_partition(date)")
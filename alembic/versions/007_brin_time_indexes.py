@@ -0,0 +1,36 @@
+"""007 — BRIN instead of B-tree for append-ordered timestamp indexes.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows arrive in roughly time order, so per-block-range min/max summaries
+    # prune range scans almost as well as a B-tree at a tiny fraction of the
+    # size and insert cost.  Nothing does point lookups on these columns.
+    op.drop_index("idx_raw_items_published", table_name="raw_items")
+    op.create_index("idx_raw_items_published_brin", "raw_items", ["published_at"],
+                    postgresql_using="brin",
+                    postgresql_with={"pages_per_range": 64})
+
+    op.drop_index("idx_events_created", table_name="update_events")
+    op.create_index("idx_events_created_brin", "update_events", ["created_at"],
+                    postgresql_using="brin",
+                    postgresql_with={"pages_per_range": 64})
+
+
+def downgrade() -> None:
+    op.drop_index("idx_events_created_brin", table_name="update_events")
+    op.create_index("idx_events_created", "update_events", ["created_at"])
+
+    op.drop_index("idx_raw_items_published_brin", table_name="raw_items")
+    op.create_index("idx_raw_items_published", "raw_items", ["published_at"])
@@ -0,0 +1,33 @@
+"""008 — Descending B-tree indexes for newest-first queries.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Event and digest listings are ORDER BY ... DESC LIMIT n; matching the
+    # index order lets them read forward from the leading edge and stop early.
+    op.drop_index("idx_events_company", table_name="update_events")
+    op.create_index("idx_events_company", "update_events",
+                    ["company_slug", sa.text("created_at DESC")])
+
+    op.drop_index("idx_digests_date", table_name="digests")
+    op.create_index("idx_digests_date", "digests", [sa.text("digest_date DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_digests_date", table_name="digests")
+    op.create_index("idx_digests_date", "digests", ["digest_date"])
+
+    op.drop_index("idx_events_company", table_name="update_events")
+    op.create_index("idx_events_company", "update_events", ["company_slug", "created_at"])
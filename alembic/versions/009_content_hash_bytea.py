@@ -0,0 +1,40 @@
+"""009 — Store content hashes as raw 32-byte BYTEA instead of hex text.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("raw_items", "snapshots")
+
+
+def upgrade() -> None:
+    # Half the key width of the hex form; idx_raw_items_hash is rebuilt
+    # as part of the type change.
+    for table in _TABLES:
+        op.alter_column(
+            table, "content_hash",
+            type_=sa.LargeBinary(32),
+            existing_type=sa.String(64),
+            existing_nullable=False,
+            postgresql_using="decode(content_hash, 'hex')",
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(
+            table, "content_hash",
+            type_=sa.String(64),
+            existing_type=sa.LargeBinary(32),
+            existing_nullable=False,
+            postgresql_using="encode(content_hash, 'hex')",
+        )
@@ -0,0 +1,25 @@
+"""010 — Partial index on update_events awaiting a digest.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The digest generator's day-bucket query is a created_at window over
+    # events with no digest yet.  Only that small, shrinking set is indexed.
+    op.create_index("idx_events_undigested", "update_events", ["created_at"],
+                    postgresql_where=sa.text("digest_id IS NULL"))
+
+
+def downgrade() -> None:
+    op.drop_index("idx_events_undigested", table_name="update_events")
@@ -0,0 +1,23 @@
+"""011 — Cached event card HTML on update_events.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filled on first view of the digest, cleared when the digest is rebuilt
+    op.add_column("update_events", sa.Column("rendered_event_html", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("update_events", "rendered_event_html")
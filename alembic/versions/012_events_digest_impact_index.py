@@ -0,0 +1,28 @@
+"""012 — Order update_events by impact within a digest.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Digest pages and previews read a digest's events by impact_score DESC
+    # (previews with a per-digest LIMIT).  The composite index serves both
+    # and also covers plain digest_id lookups, so it replaces the old one.
+    op.create_index("idx_events_digest_impact", "update_events",
+                    ["digest_id", sa.text("impact_score DESC")])
+    op.drop_index("idx_events_digest", table_name="update_events")
+
+
+def downgrade() -> None:
+    op.create_index("idx_events_digest", "update_events", ["digest_id"])
+    op.drop_index("idx_events_digest_impact", table_name="update_events")
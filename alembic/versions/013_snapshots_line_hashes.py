@@ -0,0 +1,24 @@
+"""013 — Per-line hashes on snapshots instead of the full page text.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # New snapshots store only line hashes; older rows keep diff_from_prev,
+    # which the connector still reads until the source's next snapshot
+    op.add_column("snapshots", sa.Column("line_hashes", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("snapshots", "line_hashes")
@@ -0,0 +1,25 @@
+"""014 — Markup version for the cached event card HTML.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing cards have no version, so they are re-rendered on next view
+    op.add_column(
+        "update_events", sa.Column("rendered_html_version", sa.String(16), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("update_events", "rendered_html_version")
@@ -0,0 +1,70 @@
+"""015 — Move DEFAULT-partition rows out when creating a monthly partition.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE TABLE ... PARTITION OF fails once update_events_default holds
+    # rows for that month. Build the partition as a plain table instead,
+    # move the month's rows out of DEFAULT, then attach it.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_update_events_partition(month_of date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            start_d date := date_trunc('month', month_of)::date;
+            end_d date := (date_trunc('month', month_of) + interval '1 month')::date;
+            part text := 'update_events_' || to_char(start_d, 'YYYY_MM');
+        BEGIN
+            IF to_regclass(part) IS NOT NULL THEN
+                RETURN;
+            END IF;
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE update_events INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                part
+            );
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM update_events_default '
+                'WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                start_d, end_d, part
+            );
+            EXECUTE format(
+                'ALTER TABLE update_events ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                part, start_d, end_d
+            );
+        END
+        $$
+    """)
+    # Give any month that already spilled into DEFAULT its own partition
+    op.execute("""
+        SELECT ensure_update_events_partition(m::date)
+        FROM (SELECT DISTINCT date_trunc('month', created_at) AS m FROM update_events_default) AS months
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_update_events_partition(month_of date)
+        RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            start_d date := date_trunc('month', month_of)::date;
+            end_d date := (date_trunc('month', month_of) + interval '1 month')::date;
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF update_events '
+                'FOR VALUES FROM (%L) TO (%L)',
+                'update_events_' || to_char(start_d, 'YYYY_MM'), start_d, end_d
+            );
+        END
+        $$
+    """)
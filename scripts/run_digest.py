@@ -37,6 +37,11 @@ async def main():
         action="store_true",
         help="Skip LLM summarization (use raw titles)",
     )
+    parser.add_argument(
+        "--full-archive-rebuild",
+        action="store_true",
+        help="Rebuild the archive index from the digest files on disk",
+    )
     args = parser.parse_args()
 
     import anthropic
@@ -44,6 +49,10 @@ async def main():
     from ai_digest.delivery.email_sender import send_digest_email
     from ai_digest.delivery.web_publisher import publish_web_digest, rebuild_archive
     from ai_digest.digest.generator import generate_digest
+    from ai_digest.scheduler.jobs import partition_maintenance_job
+
+    # Cron deployments have no app scheduler to run this daily
+    await partition_maintenance_job()
 
     anthropic_client = None
     if not args.no_llm and settings.anthropic_api_key:
@@ -62,7 +71,7 @@ async def main():
         # Publish web
         web_html = getattr(digest, "_web_html", None)
         if web_html:
-            url = await publish_web_digest(args.date, web_html)
+            url = await publish_web_digest(args.date, web_html, digest.event_count)
             logger.info("Published web digest: %s", url)
 
         # Send email
@@ -76,7 +85,7 @@ async def main():
                     logger.warning("Email send failed")
 
     # Rebuild archive
-    await rebuild_archive()
+    await rebuild_archive(full=args.full_archive_rebuild)
     logger.info("Done")
 
 
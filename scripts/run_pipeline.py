@@ -9,7 +9,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from ai_digest.config import settings
-from ai_digest.scheduler.jobs import fetch_source_job, pipeline_job
+from ai_digest.scheduler.jobs import (
+    fetch_source_job,
+    new_http_client,
+    partition_maintenance_job,
+    pipeline_job,
+)
 from ai_digest.database import async_session_factory
 from ai_digest.models.source import Source
 from sqlalchemy import select
@@ -20,10 +25,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Each fetch job holds its own DB session, so stay below the engine's
+# db_pool_size + db_max_overflow (see settings) to avoid queueing on
+# connection checkout.
+FETCH_CONCURRENCY = 10
+
 
 async def main():
     logger.info("Starting one-shot pipeline run")
 
+    # Cron deployments have no app scheduler; make sure this month's and
+    # next month's update_events partitions exist before inserting events
+    await partition_maintenance_job()
+
     # 1. Fetch from all enabled sources
     async with async_session_factory() as db:
         result = await db.execute(
@@ -32,12 +46,18 @@ async def main():
         sources = list(result.scalars().all())
 
     logger.info("Fetching from %d enabled sources...", len(sources))
-    for source in sources:
-        logger.info("  Fetching: %s (%s)", source.source_name, source.fetch_method)
-        try:
-            await fetch_source_job(str(source.source_id))
-        except Exception as exc:
-            logger.error("  Failed: %s", exc)
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def _fetch(source: Source, http_client) -> None:
+        async with sem:
+            logger.info("  Fetching: %s (%s)", source.source_name, source.fetch_method)
+            try:
+                await fetch_source_job(str(source.source_id), http_client)
+            except Exception as exc:
+                logger.error("  Failed: %s: %s", source.source_name, exc)
+
+    async with new_http_client() as http_client:
+        await asyncio.gather(*(_fetch(s, http_client) for s in sources))
 
     # 2. Run pipeline
     logger.info("Running pipeline...")
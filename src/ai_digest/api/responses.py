@@ -0,0 +1,117 @@
+"""Response helpers for the API routes: JSON (orjson, pydantic-core) and conditional GETs."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import AsyncIterator
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select
+
+from ai_digest.database import async_session_factory
+
+# Rows pulled from the server-side cursor per round trip
+STREAM_BATCH_SIZE = 500
+
+# datetime, date and UUID serialize natively; naive datetimes are taken as UTC
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Return it directly from a route (rather than a plain dict) to skip
+    FastAPI's ``jsonable_encoder`` pass as well.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+@lru_cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def dump_models_json(model: type[BaseModel], rows: Any) -> bytes:
+    """Validate ORM rows into ``model`` and dump them as a JSON array.
+
+    Both steps run in pydantic-core, with no per-field Python loop.
+    """
+    adapter = _list_adapter(model)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+def model_response(
+    model: type[BaseModel],
+    obj: Any,
+    status_code: int = 200,
+) -> Response:
+    """Serialize one ORM object, or a list of them, as ``model``."""
+    if isinstance(obj, (list, tuple)):
+        body = dump_models_json(model, obj)
+    else:
+        body = model.model_validate(obj, from_attributes=True).model_dump_json()
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def stream_json_array(
+    stmt: Select,
+    model: type[BaseModel],
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Serialize the scalar results of ``stmt`` as a JSON array of ``model``.
+
+    Rows come off a server-side cursor in batches of ``STREAM_BATCH_SIZE``,
+    and each batch is dumped in one pydantic-core call. Only one batch is
+    ever held in memory, and socket writes overlap with fetching the next
+    batch.
+
+    The body opens its own session: it runs after the route returns, when
+    the request-scoped one may already be closed.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"["
+        first = True
+        async with async_session_factory() as db:
+            result = await db.stream_scalars(
+                stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for batch in result.partitions():
+                if not first:
+                    yield b","
+                first = False
+                # Strip the brackets so batches join into one array
+                yield dump_models_json(model, batch)[1:-1]
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json", headers=headers)
+
+
+def version_etag(*parts: Any) -> str:
+    """Strong ETag derived from the values a response is built from."""
+    return f'"{hashlib.md5(repr(parts).encode()).hexdigest()}"'
+
+
+def is_not_modified(request: Request, response_headers) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against response validators."""
+    if if_none_match := request.headers.get("if-none-match"):
+        etag = response_headers.get("etag", "").removeprefix("W/")
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return etag in tags or "*" in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = response_headers.get("last-modified")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
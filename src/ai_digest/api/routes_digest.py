@@ -2,49 +2,85 @@
 
 from __future__ import annotations
 
-from datetime import date
+import uuid
+from datetime import date, datetime
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import HTMLResponse
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse, HTMLResponse
+from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ai_digest.api.responses import (
+    is_not_modified,
+    model_response,
+    stream_json_array,
+    version_etag,
+)
 from ai_digest.config import settings
 from ai_digest.database import get_session
 from ai_digest.models.digest import Digest
 
 router = APIRouter(prefix="/digests", tags=["digests"])
 
+# Digests change at most a few times a day; let clients reuse the list briefly
+LIST_CACHE_CONTROL = "public, max-age=60"
+
+
+class DigestSummaryOut(BaseModel):
+    digest_id: uuid.UUID
+    digest_date: date
+    event_count: int
+    generated_at: datetime | None
+    delivered_at: datetime | None
+    delivery_channels: list[str] | None
+    web_url: str | None
+
+
+class DigestOut(DigestSummaryOut):
+    overview_text: str | None
+    sections: dict
+
 
 @router.get("")
 async def list_digests(
+    request: Request,
     limit: int = 30,
     offset: int = 0,
     db: AsyncSession = Depends(get_session),
 ):
-    """List recent digests."""
+    """List recent digests.
+
+    A cheap aggregate over ``digests`` yields an ETag, so clients revalidating
+    an unchanged list get a 304 without the page query or serialization.
+    """
+    fingerprint = (await db.execute(
+        select(
+            func.max(Digest.digest_date),
+            func.count(),
+            func.max(Digest.generated_at),
+            func.max(Digest.delivered_at),
+        ).select_from(Digest)
+    )).one()
+    headers = {
+        "etag": version_etag(tuple(fingerprint), limit, offset),
+        "cache-control": LIST_CACHE_CONTROL,
+    }
+
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    # The body streams on its own session; release this one now
+    await db.close()
+
     stmt = (
         select(Digest)
         .order_by(Digest.digest_date.desc())
         .limit(limit)
         .offset(offset)
     )
-    result = await db.execute(stmt)
-    digests = result.scalars().all()
-
-    return [
-        {
-            "digest_id": str(d.digest_id),
-            "digest_date": d.digest_date.isoformat(),
-            "event_count": d.event_count,
-            "generated_at": d.generated_at.isoformat() if d.generated_at else None,
-            "delivered_at": d.delivered_at.isoformat() if d.delivered_at else None,
-            "delivery_channels": d.delivery_channels,
-            "web_url": d.web_url,
-        }
-        for d in digests
-    ]
+    return stream_json_array(stmt, DigestSummaryOut, headers=headers)
 
 
 @router.get("/{digest_date}")
@@ -60,26 +96,31 @@ async def get_digest(
     if not digest:
         raise HTTPException(status_code=404, detail="Digest not found")
 
-    return {
-        "digest_id": str(digest.digest_id),
-        "digest_date": digest.digest_date.isoformat(),
-        "overview_text": digest.overview_text,
-        "sections": digest.sections,
-        "event_count": digest.event_count,
-        "generated_at": digest.generated_at.isoformat() if digest.generated_at else None,
-        "delivered_at": digest.delivered_at.isoformat() if digest.delivered_at else None,
-        "delivery_channels": digest.delivery_channels,
-        "web_url": digest.web_url,
-    }
+    return model_response(DigestOut, digest)
 
 
 @router.get("/{digest_date}/html", response_class=HTMLResponse)
-async def get_digest_html(digest_date: date):
-    """Serve the rendered HTML digest page."""
+async def get_digest_html(digest_date: date, request: Request):
+    """Serve the rendered HTML digest page.
+
+    The file is streamed straight from disk (sendfile where available) and
+    carries ETag / Last-Modified validators so repeat fetches get a 304.
+    """
     output_dir = Path(settings.web_output_dir)
     filepath = output_dir / f"digest-{digest_date.isoformat()}.html"
 
-    if not filepath.exists():
+    try:
+        stat_result = filepath.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Digest HTML not found")
 
-    return HTMLResponse(content=filepath.read_text(encoding="utf-8"))
+    response = FileResponse(filepath, media_type="text/html", stat_result=stat_result)
+    if is_not_modified(request, response.headers):
+        return Response(
+            status_code=304,
+            headers={
+                "etag": response.headers["etag"],
+                "last-modified": response.headers["last-modified"],
+            },
+        )
+    return response
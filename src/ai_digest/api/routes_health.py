@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ai_digest.database import get_session
+from ai_digest.database import approx_row_count, get_session
 from ai_digest.models.digest import Digest
 from ai_digest.models.source import Source
 from ai_digest.models.update_event import UpdateEvent
@@ -25,14 +25,18 @@ async def health_check(db: AsyncSession = Depends(get_session)):
     except Exception:
         db_ok = False
 
-    # Source stats
-    source_count = await db.scalar(select(func.count(Source.source_id)))
-    enabled_count = await db.scalar(
-        select(func.count(Source.source_id)).where(Source.enabled.is_(True))
-    )
-
-    # Event stats
-    event_count = await db.scalar(select(func.count(UpdateEvent.event_id)))
+    # Source stats — total and enabled in one pass
+    source_count, enabled_count = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(Source.enabled.is_(True)),
+            ).select_from(Source)
+        )
+    ).one()
+
+    # Event stats — planner estimate, avoids a full scan of update_events
+    event_count = await approx_row_count(db, UpdateEvent.__tablename__)
 
     # Latest digest
     latest_digest = await db.scalar(
@@ -7,14 +7,19 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ai_digest.api.responses import model_response, stream_json_array
 from ai_digest.database import get_session
 from ai_digest.models.source import Source
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
+# Built once so every create hits the same compiled-cache entry and
+# prepared statement; row values are passed as execute() parameters.
+_INSERT_SOURCE = insert(Source).returning(Source)
+
 
 class SourceCreate(BaseModel):
     company_slug: str
@@ -46,19 +51,34 @@ class SourceUpdate(BaseModel):
     notes: str | None = None
 
 
+class SourceOut(BaseModel):
+    source_id: uuid.UUID
+    company_slug: str
+    company_name: str
+    product_line: str | None
+    source_name: str
+    source_url: str
+    fetch_method: str
+    poll_frequency_min: int
+    trust_tier: int
+    priority: str
+    parse_rules: dict
+    health_status: str
+    last_fetched_at: datetime | None
+    last_item_at: datetime | None
+    enabled: bool
+    notes: str | None
+    created_at: datetime | None
+    updated_at: datetime | None
+
+
 @router.get("")
-async def list_sources(
-    enabled_only: bool = False,
-    db: AsyncSession = Depends(get_session),
-):
-    """List all sources."""
+async def list_sources(enabled_only: bool = False):
+    """List all sources (streamed)."""
     stmt = select(Source).order_by(Source.company_slug, Source.source_name)
     if enabled_only:
         stmt = stmt.where(Source.enabled.is_(True))
-    result = await db.execute(stmt)
-    sources = result.scalars().all()
-
-    return [_source_to_dict(s) for s in sources]
+    return stream_json_array(stmt, SourceOut)
 
 
 @router.get("/{source_id}")
@@ -73,7 +93,7 @@ async def get_source(
     source = result.scalar_one_or_none()
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
-    return _source_to_dict(source)
+    return model_response(SourceOut, source)
 
 
 @router.post("", status_code=201)
@@ -82,14 +102,27 @@ async def create_source(
     db: AsyncSession = Depends(get_session),
 ):
     """Create a new source."""
-    source = Source(
-        source_id=uuid.uuid4(),
-        **body.model_dump(),
+    result = await db.execute(
+        _INSERT_SOURCE, [{"source_id": uuid.uuid4(), **body.model_dump()}]
     )
-    db.add(source)
+    source = result.scalar_one()
     await db.commit()
-    await db.refresh(source)
-    return _source_to_dict(source)
+    return model_response(SourceOut, source, status_code=201)
+
+
+@router.post("/bulk", status_code=201)
+async def create_sources_bulk(
+    body: list[SourceCreate],
+    db: AsyncSession = Depends(get_session),
+):
+    """Create many sources with one batched INSERT ... RETURNING."""
+    if not body:
+        return []
+    payload = [{"source_id": uuid.uuid4(), **item.model_dump()} for item in body]
+    result = await db.execute(_INSERT_SOURCE, payload)
+    sources = result.scalars().all()
+    await db.commit()
+    return model_response(SourceOut, list(sources), status_code=201)
 
 
 @router.patch("/{source_id}")
@@ -99,21 +132,19 @@ async def update_source(
     db: AsyncSession = Depends(get_session),
 ):
     """Update an existing source."""
+    update_data = body.model_dump(exclude_unset=True)
     result = await db.execute(
-        select(Source).where(Source.source_id == source_id)
+        update(Source)
+        .where(Source.source_id == source_id)
+        .values(**update_data, updated_at=datetime.now(timezone.utc))
+        .returning(Source)
     )
     source = result.scalar_one_or_none()
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    update_data = body.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(source, key, value)
-    source.updated_at = datetime.now(timezone.utc)
-
     await db.commit()
-    await db.refresh(source)
-    return _source_to_dict(source)
+    return model_response(SourceOut, source)
 
 
 @router.delete("/{source_id}", status_code=204)
@@ -123,34 +154,12 @@ async def delete_source(
 ):
     """Delete a source."""
     result = await db.execute(
-        select(Source).where(Source.source_id == source_id)
+        delete(Source)
+        .where(Source.source_id == source_id)
+        .returning(Source.source_id)
     )
-    source = result.scalar_one_or_none()
-    if not source:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    await db.delete(source)
     await db.commit()
 
-
-def _source_to_dict(source: Source) -> dict:
-    return {
-        "source_id": str(source.source_id),
-        "company_slug": source.company_slug,
-        "company_name": source.company_name,
-        "product_line": source.product_line,
-        "source_name": source.source_name,
-        "source_url": source.source_url,
-        "fetch_method": source.fetch_method,
-        "poll_frequency_min": source.poll_frequency_min,
-        "trust_tier": source.trust_tier,
-        "priority": source.priority,
-        "parse_rules": source.parse_rules,
-        "health_status": source.health_status,
-        "last_fetched_at": source.last_fetched_at.isoformat() if source.last_fetched_at else None,
-        "last_item_at": source.last_item_at.isoformat() if source.last_item_at else None,
-        "enabled": source.enabled,
-        "notes": source.notes,
-        "created_at": source.created_at.isoformat() if source.created_at else None,
-        "updated_at": source.updated_at.isoformat() if source.updated_at else None,
-    }
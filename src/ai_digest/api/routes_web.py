@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import logging
 import re
-from datetime import date, datetime, timezone
+import threading
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from datetime import date
+from functools import lru_cache
 from html import escape as _esc
+from itertools import groupby
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse, PlainTextResponse
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup
+from sqlalchemy import Row, Select, bindparam, case, func, select, true, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from starlette.background import BackgroundTask
 
+from ai_digest.api.responses import is_not_modified, version_etag
 from ai_digest.config import settings
-from ai_digest.database import get_session
+from ai_digest.database import async_session_factory, gather_sessions, get_session
+from ai_digest.digest.renderer import format_digest_date
 from ai_digest.models.digest import Digest
 from ai_digest.models.raw_item import RawItem
 from ai_digest.models.source import Source
 from ai_digest.models.update_event import UpdateEvent
+from ai_digest.pipeline.summarizer import normalize_what_changed
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["web"])
 
@@ -26,16 +45,25 @@ _MD_HEADER_RE = re.compile(r"^#{1,6}\s+", re.MULTILINE)
 _MD_NOISE_RE = re.compile(
     r"^(\s*[-*]\s*(Updated dependencies|Bumped|@[\w/.-]+).*$)", re.MULTILINE
 )
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_MD_CODE_RE = re.compile(r"`([^`]*)`")
+_LIST_MARKER_RE = re.compile(r"^[\s*-]+", re.MULTILINE)
+_WS_RE = re.compile(r"\s+")
+_ALPHA_RE = re.compile(r"[A-Za-z]{2,}")
+
+# Titles and summaries backfilled from raw content keep at most a couple of
+# hundred characters, so only this much of the raw body is cleaned.
+RAW_TEXT_SCAN_CHARS = 2000
 
 
 def _strip_markup(text: str) -> str:
     """Remove HTML tags, markdown formatting, and collapse whitespace."""
     clean = _TAG_RE.sub(" ", text)
     clean = _MD_HEADER_RE.sub("", clean)
-    clean = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", clean)  # [text](url) → text
-    clean = re.sub(r"`([^`]*)`", r"\1", clean)  # `code` → code
-    clean = re.sub(r"^[\s*-]+", "", clean, flags=re.MULTILINE)  # list markers
-    clean = re.sub(r"\s+", " ", clean).strip()
+    clean = _MD_LINK_RE.sub(r"\1", clean)  # [text](url) → text
+    clean = _MD_CODE_RE.sub(r"\1", clean)  # `code` → code
+    clean = _LIST_MARKER_RE.sub("", clean)  # list markers
+    clean = _WS_RE.sub(" ", clean).strip()
     return clean
 
 
@@ -44,11 +72,17 @@ def _is_readable(text: str) -> bool:
     words = text.split()
     if len(words) < 3:
         return False
-    alpha_words = sum(1 for w in words if re.search(r"[a-zA-Z]{2,}", w))
+    alpha_words = sum(1 for w in words if _ALPHA_RE.search(w))
     return alpha_words / len(words) > 0.3
 
 
+# Host part of scheme://[www.]host[/?#...]; only the label is needed
+_HOST_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://(?:www\.)?([^/?#]+)")
 _REPO_RE = re.compile(r"([\w.-]+)\s*/\s*([\w.-]+)")
+_REPO_NOISE_RE = re.compile(
+    r"^(Star\b|Built by\b|stars? today\b|Sponsored\b).*", re.IGNORECASE
+)
+_COUNT_RE = re.compile(r"[\d,]+")
 
 
 def _extract_repo_info(text: str) -> tuple[str, str] | None:
@@ -64,14 +98,11 @@ def _extract_repo_info(text: str) -> tuple[str, str] | None:
     # Grab the text after the repo name as description
     after = clean[m.end():].strip()
     # Remove leading noise: language names, star counts, "Star", "Built by"
-    after = re.sub(
-        r"^(Star\b|Built by\b|stars? today\b|Sponsored\b).*", "", after,
-        flags=re.IGNORECASE,
-    ).strip()
+    after = _REPO_NOISE_RE.sub("", after).strip()
     # Take first sentence-like chunk (before numbers dominate)
     desc_words = []
     for word in after.split():
-        if re.fullmatch(r"[\d,]+", word) and len(desc_words) > 2:
+        if _COUNT_RE.fullmatch(word) and len(desc_words) > 2:
             break
         desc_words.append(word)
     desc = " ".join(desc_words).strip(" .,;-")
@@ -79,393 +110,13 @@ def _extract_repo_info(text: str) -> tuple[str, str] | None:
     return title, desc or repo
 
 
-def _page(title: str, body: str) -> str:
-    """Wrap body HTML in the full page layout."""
-    return f"""<!DOCTYPE html>
+_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>{title} — AI Daily Digest</title>
-  <style>
-    :root {{
-      --bg: #0f0f1a;
-      --surface: #1a1a2e;
-      --surface2: #222240;
-      --primary: #6c63ff;
-      --primary-light: #8b83ff;
-      --accent: #00d4aa;
-      --text: #e8e8f0;
-      --text-muted: #8888a8;
-      --border: #2a2a45;
-      --high: #ff4757;
-      --medium: #ffa502;
-      --low: #2ed573;
-    }}
-    * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-    body {{
-      background: var(--bg);
-      color: var(--text);
-      font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-      line-height: 1.6;
-    }}
-    a {{ color: var(--primary-light); text-decoration: none; }}
-    a:hover {{ color: var(--accent); }}
-
-    /* Nav */
-    nav {{
-      background: var(--surface);
-      border-bottom: 1px solid var(--border);
-      padding: 16px 0;
-      position: sticky; top: 0; z-index: 100;
-    }}
-    nav .inner {{
-      max-width: 1100px; margin: 0 auto; padding: 0 24px;
-      display: flex; justify-content: space-between; align-items: center;
-    }}
-    nav .logo {{ font-size: 20px; font-weight: 700; color: #fff; }}
-    nav .logo span {{ color: var(--primary-light); }}
-    nav .links a {{
-      color: var(--text-muted); margin-left: 24px; font-size: 14px; font-weight: 500;
-    }}
-    nav .links a:hover {{ color: #fff; }}
-    nav .links a.active {{ color: var(--primary-light); }}
-
-    /* Container */
-    .container {{ max-width: 1100px; margin: 0 auto; padding: 32px 24px; }}
-
-    /* Hero */
-    .hero {{
-      text-align: center; padding: 60px 24px 40px;
-    }}
-    .hero h1 {{ font-size: 42px; font-weight: 800; margin-bottom: 12px; }}
-    .hero h1 span {{ color: var(--primary-light); }}
-    .hero p {{ font-size: 18px; color: var(--text-muted); max-width: 600px; margin: 0 auto 32px; }}
-    .hero .cta {{
-      display: inline-block; background: var(--primary); color: #fff;
-      padding: 12px 32px; border-radius: 8px; font-weight: 600; font-size: 16px;
-      transition: background 0.2s;
-    }}
-    .hero .cta:hover {{ background: var(--primary-light); color: #fff; }}
-
-    /* Stats bar */
-    .stats {{
-      display: flex; gap: 24px; justify-content: center; flex-wrap: wrap;
-      margin: 32px 0 48px;
-    }}
-    .stat {{
-      background: var(--surface); border: 1px solid var(--border);
-      border-radius: 12px; padding: 20px 32px; text-align: center; min-width: 160px;
-    }}
-    .stat .num {{ font-size: 32px; font-weight: 800; color: var(--primary-light); }}
-    .stat .label {{ font-size: 13px; color: var(--text-muted); margin-top: 4px; }}
-
-    /* Cards */
-    .card {{
-      background: var(--surface); border: 1px solid var(--border);
-      border-radius: 12px; padding: 24px; margin-bottom: 16px;
-      transition: border-color 0.2s;
-    }}
-    .card:hover {{ border-color: var(--primary); }}
-    .card h3 {{ font-size: 18px; margin-bottom: 8px; }}
-    .card .meta {{ font-size: 13px; color: var(--text-muted); }}
-    .card-summary {{
-      font-size: 13px; color: var(--text-muted); line-height: 1.5;
-      margin-top: 10px; padding-top: 10px;
-      border-top: 1px solid var(--border);
-    }}
-    .preview-list {{ margin-top: 10px; }}
-    .preview-item {{
-      font-size: 13px; color: var(--text);
-      padding: 4px 0;
-      white-space: nowrap; overflow: hidden; text-overflow: ellipsis;
-    }}
-
-    /* Section titles */
-    .section-title {{
-      font-size: 13px; font-weight: 700; text-transform: uppercase;
-      letter-spacing: 2px; color: var(--primary-light);
-      margin: 40px 0 20px; padding-bottom: 12px;
-      border-bottom: 2px solid var(--border);
-      flex: 1;
-    }}
-    .section-header {{
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      gap: 12px;
-    }}
-    .section-toggle {{
-      width: 28px; height: 28px;
-      border-radius: 6px;
-      border: 1px solid var(--border);
-      background: var(--surface2);
-      color: var(--text-muted);
-      cursor: pointer;
-      display: inline-flex;
-      align-items: center;
-      justify-content: center;
-      transition: border-color 0.2s, color 0.2s, transform 0.2s;
-    }}
-    .section-toggle:hover {{
-      border-color: var(--primary-light);
-      color: var(--primary-light);
-    }}
-    .section-toggle .chev {{
-      display: block;
-      transition: transform 0.2s ease;
-    }}
-    .section.section-collapsed .section-toggle .chev {{
-      transform: rotate(-90deg);
-    }}
-    .section-body {{
-      display: grid;
-      grid-template-rows: 1fr;
-      transition: grid-template-rows 0.25s ease, opacity 0.2s ease;
-    }}
-    .section-body .section-inner {{
-      overflow: hidden;
-    }}
-    .section.section-collapsed .section-body {{
-      grid-template-rows: 0fr;
-      opacity: 0;
-      pointer-events: none;
-    }}
-
-    /* Filters */
-    .filter-bar {{
-      display: flex; flex-wrap: wrap; gap: 8px;
-      margin: 12px 0 24px;
-    }}
-    .filter-chip {{
-      padding: 6px 12px;
-      border-radius: 999px;
-      border: 1px solid var(--border);
-      background: var(--surface);
-      color: var(--text-muted);
-      font-size: 12px;
-      cursor: pointer;
-      transition: all 0.2s ease;
-    }}
-    .filter-chip.active {{
-      background: rgba(108,99,255,0.16);
-      border-color: var(--primary-light);
-      color: var(--primary-light);
-    }}
-
-    /* Badges */
-    .badge {{
-      display: inline-block; font-size: 11px; font-weight: 700;
-      padding: 3px 10px; border-radius: 4px; margin-right: 6px;
-      vertical-align: middle;
-    }}
-    .badge-high {{ background: rgba(255,71,87,0.15); color: var(--high); }}
-    .badge-medium {{ background: rgba(255,165,2,0.15); color: var(--medium); }}
-    .badge-low {{ background: rgba(46,213,115,0.15); color: var(--low); }}
-    .badge-cat {{ background: rgba(108,99,255,0.12); color: var(--primary-light); }}
-    .badge-tier {{ background: rgba(0,212,170,0.12); color: var(--accent); }}
-
-    /* Source table */
-    .source-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr)); gap: 16px; }}
-    .source-card {{
-      background: var(--surface); border: 1px solid var(--border);
-      border-radius: 10px; padding: 18px; transition: border-color 0.2s;
-    }}
-    .source-card:hover {{ border-color: var(--primary); }}
-    .source-card .company {{ font-size: 12px; color: var(--accent); font-weight: 600; text-transform: uppercase; letter-spacing: 1px; }}
-    .source-card .name {{ font-size: 16px; font-weight: 600; margin: 4px 0 8px; }}
-    .source-card .details {{ font-size: 13px; color: var(--text-muted); }}
-
-    /* ---------- Redesigned Event Cards ---------- */
-    .event-card {{
-      background: var(--surface);
-      border: 1px solid var(--border);
-      border-radius: 10px;
-      padding: 20px 24px;
-      margin-bottom: 14px;
-      transition: border-color 0.2s, box-shadow 0.2s;
-    }}
-    .event-card:hover {{
-      border-color: var(--primary);
-      box-shadow: 0 2px 16px rgba(108,99,255,0.08);
-    }}
-    .event-card.severity-high {{ border-left: 4px solid var(--high); }}
-    .event-card.severity-medium {{ border-left: 4px solid var(--medium); }}
-    .event-card.severity-low {{ border-left: 4px solid var(--low); }}
-
-    .event-header {{
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      gap: 12px;
-      margin-bottom: 10px;
-    }}
-    .event-header .event-title {{
-      font-size: 17px;
-      font-weight: 700;
-      color: #fff;
-      line-height: 1.4;
-      flex: 1;
-    }}
-    .event-header .event-title .rank {{
-      color: var(--primary-light);
-      margin-right: 6px;
-    }}
-    .event-tags {{
-      display: flex;
-      flex-wrap: wrap;
-      gap: 6px;
-      margin-bottom: 10px;
-    }}
-    .event-company-line {{
-      font-size: 13px;
-      color: var(--accent);
-      font-weight: 600;
-      margin-bottom: 8px;
-    }}
-    .event-summary {{
-      font-size: 13px;
-      color: var(--text-muted);
-      line-height: 1.5;
-      margin-bottom: 14px;
-      padding: 10px 14px;
-      background: rgba(108,99,255,0.04);
-      border-radius: 6px;
-      border-left: 3px solid var(--primary);
-      overflow: hidden;
-      max-height: 4.5em;
-    }}
-
-    .event-body {{
-      font-size: 14px;
-      color: var(--text);
-      line-height: 1.7;
-    }}
-    .event-body .label {{
-      display: block;
-      font-size: 11px;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 1px;
-      color: var(--text-muted);
-      margin: 14px 0 6px 0;
-    }}
-    .event-body .label:first-child {{ margin-top: 0; }}
-    .event-body ul {{
-      padding-left: 18px;
-      margin: 4px 0 0 0;
-    }}
-    .event-body li {{
-      margin-bottom: 5px;
-      color: var(--text);
-    }}
-    .event-body li a {{
-      font-size: 12px;
-      color: var(--primary-light);
-      margin-left: 4px;
-    }}
-    .event-body p {{
-      margin: 4px 0 0 0;
-      color: var(--text-muted);
-    }}
-
-    .event-footer {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-top: 14px;
-      padding-top: 12px;
-      border-top: 1px solid var(--border);
-      font-size: 12px;
-      color: var(--text-muted);
-    }}
-    .event-footer a {{
-      color: var(--primary-light);
-      font-weight: 500;
-    }}
-    .event-footer a:hover {{ color: var(--accent); }}
-    .event-source-links {{
-      display: flex;
-      gap: 10px;
-      flex-wrap: wrap;
-    }}
-    .event-source-links a {{
-      background: rgba(108,99,255,0.08);
-      padding: 3px 10px;
-      border-radius: 4px;
-      font-size: 12px;
-      transition: background 0.2s;
-    }}
-    .event-source-links a:hover {{
-      background: rgba(108,99,255,0.2);
-    }}
-
-    /* Compact events (everything else) */
-    .compact-event {{
-      display: flex;
-      align-items: center;
-      gap: 12px;
-      padding: 10px 16px;
-      border-radius: 8px;
-      margin-bottom: 4px;
-      transition: background 0.15s;
-    }}
-    .compact-event:hover {{ background: var(--surface2); }}
-    .compact-event .ce-content {{
-      flex: 1;
-      min-width: 0;
-    }}
-    .compact-event .ce-title {{
-      font-size: 14px;
-      font-weight: 500;
-      display: block;
-    }}
-    .compact-event .ce-summary {{
-      font-size: 12px;
-      color: var(--text-muted);
-      line-height: 1.4;
-      margin-top: 3px;
-      overflow: hidden;
-      max-height: 2.8em;
-    }}
-    .compact-event .ce-company {{
-      font-size: 12px;
-      color: var(--accent);
-      min-width: 100px;
-      flex-shrink: 0;
-    }}
-
-    /* Download button */
-    .btn {{
-      display: inline-flex;
-      align-items: center;
-      gap: 6px;
-      padding: 8px 18px;
-      border-radius: 6px;
-      font-size: 13px;
-      font-weight: 600;
-      transition: all 0.2s;
-      cursor: pointer;
-      border: none;
-    }}
-    .btn-outline {{
-      background: transparent;
-      border: 1px solid var(--border);
-      color: var(--text-muted);
-    }}
-    .btn-outline:hover {{
-      border-color: var(--primary-light);
-      color: var(--primary-light);
-      background: rgba(108,99,255,0.06);
-    }}
-
-    /* Footer */
-    footer {{
-      text-align: center; padding: 40px 24px;
-      color: var(--text-muted); font-size: 13px;
-      border-top: 1px solid var(--border); margin-top: 60px;
-    }}
-  </style>
+  <link rel="stylesheet" href="/static/digest.css?v={css_version}">
 </head>
 <body>
   <nav>
@@ -487,64 +138,285 @@ def _page(title: str, body: str) -> str:
 </html>"""
 
 
-@router.get("/", response_class=HTMLResponse)
-async def homepage(db: AsyncSession = Depends(get_session)):
-    """Main dashboard / homepage."""
-    source_count = await db.scalar(select(func.count(Source.source_id)))
-    enabled_count = await db.scalar(
-        select(func.count(Source.source_id)).where(Source.enabled.is_(True))
+# The stylesheet URL carries a content hash, so it can be cached as immutable
+_STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+_CSS_VERSION = hashlib.sha256((_STATIC_DIR / "digest.css").read_bytes()).hexdigest()[:12]
+
+# Split once at import; pages are then plain concatenation around the title
+# and body (streamed pages emit the head first).
+_PAGE_HEAD, _PAGE_FOOT = _PAGE_TEMPLATE.replace("{css_version}", _CSS_VERSION).split("{body}")
+_HEAD_BEFORE_TITLE, _HEAD_AFTER_TITLE = _PAGE_HEAD.split("{title}")
+
+
+def _page_head(title: str) -> str:
+    return _HEAD_BEFORE_TITLE + title + _HEAD_AFTER_TITLE
+
+
+def _page(title: str, body: str) -> str:
+    """Wrap body HTML in the full page layout (styles live in /static/digest.css)."""
+    return _HEAD_BEFORE_TITLE + title + _HEAD_AFTER_TITLE + body + _PAGE_FOOT
+
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """Extract a short domain label from a URL.
+
+    Cached because the same citation URLs recur across events and digests.
+    """
+    m = _HOST_RE.match(url)
+    return m.group(1) if m else url[:30]
+
+
+# Card templates are compiled once at import; autoescape replaces _esc().
+_UI_TEMPLATES_DIR = Path(__file__).resolve().parent.parent.parent.parent / "templates" / "ui"
+
+_ui_env = Environment(
+    loader=FileSystemLoader(str(_UI_TEMPLATES_DIR)),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+# Badges repeat on every card; build each distinct one once
+_SEVERITY_BADGE = Markup('<span class="badge badge-{}">{}</span>')
+_CATEGORY_BADGE = Markup('<span class="badge badge-cat">{}</span>')
+_SEVERITY_BADGES = {
+    sev: _SEVERITY_BADGE.format(sev.lower(), sev) for sev in ("HIGH", "MEDIUM", "LOW")
+}
+
+
+def _severity_badge(severity: str | None) -> Markup:
+    if badge := _SEVERITY_BADGES.get(severity):
+        return badge
+    return _SEVERITY_BADGE.format(severity.lower() if severity else "low", severity)
+
+
+@lru_cache(maxsize=1024)
+def _category_badge(category: str) -> Markup:
+    return _CATEGORY_BADGE.format(category)
+
+
+_ui_env.filters["domain"] = _extract_domain
+_ui_env.filters["severity_badge"] = _severity_badge
+_ui_env.filters["category_badge"] = _category_badge
+
+_EVENT_CARD_TMPL = _ui_env.get_template("event_card.html")
+_EVENT_CARD_BODY_TMPL = _ui_env.get_template("event_card_body.html")
+_COMPACT_EVENT_TMPL = _ui_env.get_template("compact_event.html")
+_DIGEST_CARD_TMPL = _ui_env.get_template("digest_card.html")
+
+
+def _event_summary(ev: UpdateEvent) -> str:
+    """Summary text — try dedicated fields, fall back to first what_changed fact."""
+    summary = ev.summary_short or ev.summary_medium or ev.why_it_matters or ""
+    if not summary and ev.what_changed:
+        return ev.what_changed[0]["fact"]
+    return summary
+
+
+# Identifies the markup stored in update_events.rendered_event_html; cards
+# saved under another version (an older template or badge) are re-rendered
+_CARD_VERSION = hashlib.md5(
+    repr((
+        (_UI_TEMPLATES_DIR / "event_card_body.html").read_bytes(),
+        str(_SEVERITY_BADGE),
+        str(_CATEGORY_BADGE),
+        _HOST_RE.pattern,
+    )).encode()
+).hexdigest()[:16]
+
+
+def _card_is_stale(ev: UpdateEvent) -> bool:
+    return ev.rendered_event_html is None or ev.rendered_html_version != _CARD_VERSION
+
+
+def _event_card(ev: UpdateEvent, numbered: int = 0) -> str:
+    """Event card HTML around the cached body in ``ev.rendered_event_html``.
+
+    The body (tags, summary, facts, links) is cached; a stale or missing
+    one is re-rendered and stored back on ``ev`` for the caller to persist.
+    The header, with the title and the Top 5 rank, is rendered each time.
+    """
+    if _card_is_stale(ev):
+        ev.rendered_event_html = _EVENT_CARD_BODY_TMPL.render(ev=ev, summary=_event_summary(ev))
+        ev.rendered_html_version = _CARD_VERSION
+    return _EVENT_CARD_TMPL.render(
+        ev=ev,
+        rank=numbered,
+        sev_class=ev.severity.lower() if ev.severity else "low",
+        body=Markup(ev.rendered_event_html),
+    )
+
+
+async def _save_event_cards(events: list[UpdateEvent]) -> None:
+    """Persist newly rendered event cards (best effort)."""
+    table = UpdateEvent.__table__
+    stmt = (
+        update(table)
+        # created_at is the partition key; without it every partition is probed
+        .where(
+            table.c.event_id == bindparam("b_event_id"),
+            table.c.created_at == bindparam("b_created_at"),
+        )
+        .values(rendered_event_html=bindparam("b_html"), rendered_html_version=_CARD_VERSION)
     )
-    event_count = await db.scalar(select(func.count(UpdateEvent.event_id)))
-    digest_count = await db.scalar(select(func.count(Digest.digest_id)))
+    params = [
+        {"b_event_id": ev.event_id, "b_created_at": ev.created_at, "b_html": ev.rendered_event_html}
+        for ev in events
+    ]
+    try:
+        async with async_session_factory() as session:
+            await session.execute(stmt, params)
+            await session.commit()
+    except (SQLAlchemyError, OSError):
+        logger.warning("Could not store rendered event cards", exc_info=True)
+
+
+def _render_compact(ev: UpdateEvent) -> str:
+    return _COMPACT_EVENT_TMPL.render(
+        ev=ev,
+        sev_class=ev.severity.lower() if ev.severity else "low",
+        summary=_event_summary(ev),
+    )
+
 
-    # Latest digest
-    latest = await db.scalar(
-        select(Digest.digest_date).order_by(Digest.digest_date.desc()).limit(1)
+def _render_digest_card(d: Row, previews: list[Row], archive: bool = False) -> str:
+    overview = ""
+    if d.overview_text:
+        overview = d.overview_text[:180]
+        if len(d.overview_text) > 180:
+            overview += "..."
+    return _DIGEST_CARD_TMPL.render(
+        d=d,
+        previews=previews,
+        overview=overview,
+        archive=archive,
+        date_label=format_digest_date(d.digest_date),
+        generated_label=d.generated_at.strftime("%H:%M UTC") if d.generated_at else "N/A",
     )
 
-    # Recent digests
+
+PREVIEW_EVENTS_PER_DIGEST = 3
+
+# Only what the digest cards render; plain rows skip ORM hydration
+_DIGEST_CARD_COLUMNS = (
+    Digest.digest_id,
+    Digest.digest_date,
+    Digest.event_count,
+    Digest.generated_at,
+    Digest.overview_text,
+    Digest.delivery_channels,
+)
+
+# Rendered pages per process, keyed by page and validated against a cheap
+# version tuple read from the DB.  Dicts keep insertion order, so eviction
+# of the oldest entry is FIFO.
+RENDER_CACHE_SIZE = 64
+
+# A generated digest only changes if it is regenerated (new ETag)
+VIEW_CACHE_CONTROL = "public, max-age=3600, stale-while-revalidate=86400"
+ARCHIVE_CACHE_CONTROL = "public, max-age=60"
+# Fetch jobs touch last_fetched_at often; revalidation is a single aggregate.
+# Private: the page lists the internal source registry, so shared caches
+# shouldn't hold it
+SOURCES_CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=300"
+_rendered_cache: dict[tuple, tuple[tuple, str]] = {}
+# Streamed views store pages from threadpool threads
+_rendered_cache_lock = threading.Lock()
+
+
+def _cached_page(key: tuple, version: tuple) -> str | None:
+    hit = _rendered_cache.get(key)
+    if hit is not None and hit[0] == version:
+        return hit[1]
+    return None
+
+
+def _store_page(key: tuple, version: tuple, html: str) -> str:
+    with _rendered_cache_lock:
+        _rendered_cache.pop(key, None)
+        if len(_rendered_cache) >= RENDER_CACHE_SIZE:
+            _rendered_cache.pop(next(iter(_rendered_cache)))
+        _rendered_cache[key] = (version, html)
+    return html
+
+
+async def _preview_events(
+    db: AsyncSession, digest_ids: list[uuid.UUID] | Select
+) -> dict[uuid.UUID, list[Row]]:
+    """Top events per digest (by impact) as light (title, severity) rows.
+
+    A LATERAL subquery takes the top events of each digest straight off
+    ``idx_events_digest_impact`` (an index-ordered LIMIT per digest), so
+    only the preview rows are read and no ORM entities are hydrated.
+    ``digest_ids`` may also be a SELECT of ids, so the previews can be
+    fetched alongside the digest rows rather than after them.
+    """
+    if isinstance(digest_ids, list) and not digest_ids:
+        return {}
+    top = (
+        select(UpdateEvent.title, UpdateEvent.severity, UpdateEvent.impact_score)
+        .where(UpdateEvent.digest_id == Digest.digest_id)
+        .order_by(UpdateEvent.impact_score.desc())
+        .limit(PREVIEW_EVENTS_PER_DIGEST)
+        .lateral("top_events")
+    )
     result = await db.execute(
-        select(Digest).order_by(Digest.digest_date.desc()).limit(7)
+        select(Digest.digest_id, top.c.title, top.c.severity)
+        .join(top, true())
+        .where(Digest.digest_id.in_(digest_ids))
+        .order_by(Digest.digest_id, top.c.impact_score.desc())
     )
-    digests = result.scalars().all()
+    previews: dict[uuid.UUID, list[Row]] = {}
+    for row in result:
+        previews.setdefault(row.digest_id, []).append(row)
+    return previews
 
-    # Load top 3 events per digest for preview
-    digest_ids = [d.digest_id for d in digests]
-    top_events_by_digest: dict[str, list[UpdateEvent]] = {str(d.digest_id): [] for d in digests}
-    if digest_ids:
-        ev_result = await db.execute(
-            select(UpdateEvent)
-            .where(UpdateEvent.digest_id.in_(digest_ids))
-            .order_by(UpdateEvent.impact_score.desc())
+
+@router.get("/", response_class=HTMLResponse)
+async def homepage(db: AsyncSession = Depends(get_session)):
+    """Main dashboard / homepage."""
+    # Stats, latest digest date and cache version in a single round trip
+    stats = await db.execute(
+        select(
+            select(func.count(Source.source_id)).scalar_subquery(),
+            select(func.count(Source.source_id))
+            .where(Source.enabled.is_(True))
+            .scalar_subquery(),
+            select(func.count(UpdateEvent.event_id)).scalar_subquery(),
+            select(func.count(Digest.digest_id)).scalar_subquery(),
+            select(func.max(Digest.digest_date)).scalar_subquery(),
+            select(func.max(Digest.generated_at)).scalar_subquery(),
         )
-        for ev in ev_result.scalars().all():
-            bucket = top_events_by_digest.get(str(ev.digest_id), [])
-            if len(bucket) < 3:
-                bucket.append(ev)
-                top_events_by_digest[str(ev.digest_id)] = bucket
-
-    digest_cards = ""
-    for d in digests:
-        overview_snippet = ""
-        if d.overview_text:
-            text = d.overview_text[:180]
-            if len(d.overview_text) > 180:
-                text += "..."
-            overview_snippet = f'<div class="card-summary">{_esc(text)}</div>'
-
-        top_evs = top_events_by_digest.get(str(d.digest_id), [])
-        preview_items = ""
-        for ev in top_evs:
-            sev_class = ev.severity.lower() if ev.severity else "low"
-            preview_items += f'<div class="preview-item"><span class="badge badge-{sev_class}" style="font-size:10px;padding:2px 6px;">{ev.severity}</span> {_esc(ev.title)}</div>'
-
-        digest_cards += f"""
-        <a href="/view/{d.digest_date.isoformat()}" class="card" style="display:block;">
-          <h3>{d.digest_date.strftime('%B %d, %Y')}</h3>
-          <div class="meta">{d.event_count} items &middot; Generated {d.generated_at.strftime('%H:%M UTC') if d.generated_at else 'N/A'}</div>
-          {overview_snippet}
-          <div class="preview-list">{preview_items}</div>
-        </a>"""
+    )
+    (
+        source_count, enabled_count, event_count, digest_count, latest, last_generated,
+    ) = stats.one()
+
+    await db.close()
+
+    version = (source_count, enabled_count, event_count, digest_count, last_generated)
+    if (html := _cached_page(("home",), version)) is not None:
+        return HTMLResponse(html)
+
+    # Recent digests and their top 3 events, fetched concurrently (each on
+    # its own session: one AsyncSession cannot run two queries at once)
+    recent_ids = select(Digest.digest_id).order_by(Digest.digest_date.desc()).limit(7)
+
+    async def load_digests(s: AsyncSession) -> list[Row]:
+        result = await s.execute(
+            select(*_DIGEST_CARD_COLUMNS).order_by(Digest.digest_date.desc()).limit(7)
+        )
+        return result.all()
+
+    async def load_previews(s: AsyncSession) -> dict[uuid.UUID, list[Row]]:
+        return await _preview_events(s, recent_ids)
+
+    digests, top_events_by_digest = await gather_sessions(load_digests, load_previews)
+
+    digest_cards = "".join(
+        _render_digest_card(d, top_events_by_digest.get(d.digest_id, []))
+        for d in digests
+    )
 
     if not digest_cards:
         digest_cards = '<p style="color:var(--text-muted);">No digests generated yet. Run <code>python scripts/run_digest.py</code></p>'
@@ -568,60 +440,37 @@ async def homepage(db: AsyncSession = Depends(get_session)):
       {digest_cards}
     </div>
     """
-    return HTMLResponse(_page("Home", body))
+    return HTMLResponse(_store_page(("home",), version, _page("Home", body)))
 
 
 @router.get("/archive", response_class=HTMLResponse)
-async def archive_page(db: AsyncSession = Depends(get_session)):
+async def archive_page(request: Request, db: AsyncSession = Depends(get_session)):
     """Digest archive page."""
+    version = tuple((await db.execute(
+        select(
+            func.count(Digest.digest_id),
+            func.max(Digest.generated_at),
+            func.max(Digest.delivered_at),
+        )
+    )).one())
+    headers = {"etag": version_etag("archive", version), "cache-control": ARCHIVE_CACHE_CONTROL}
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    if (html := _cached_page(("archive",), version)) is not None:
+        return HTMLResponse(html, headers=headers)
+
     result = await db.execute(
-        select(Digest).order_by(Digest.digest_date.desc()).limit(100)
+        select(*_DIGEST_CARD_COLUMNS).order_by(Digest.digest_date.desc()).limit(100)
     )
-    digests = result.scalars().all()
+    digests = result.all()
 
     # Load top 3 events per digest for preview
-    digest_ids = [d.digest_id for d in digests]
-    top_events_by_digest: dict[str, list[UpdateEvent]] = {str(d.digest_id): [] for d in digests}
-    if digest_ids:
-        ev_result = await db.execute(
-            select(UpdateEvent)
-            .where(UpdateEvent.digest_id.in_(digest_ids))
-            .order_by(UpdateEvent.impact_score.desc())
-        )
-        for ev in ev_result.scalars().all():
-            bucket = top_events_by_digest.get(str(ev.digest_id), [])
-            if len(bucket) < 3:
-                bucket.append(ev)
-                top_events_by_digest[str(ev.digest_id)] = bucket
-
-    cards = ""
-    for d in digests:
-        overview_snippet = ""
-        if d.overview_text:
-            text = d.overview_text[:180]
-            if len(d.overview_text) > 180:
-                text += "..."
-            overview_snippet = f'<div class="card-summary">{_esc(text)}</div>'
-
-        top_evs = top_events_by_digest.get(str(d.digest_id), [])
-        preview_items = ""
-        for ev in top_evs:
-            sev_class = ev.severity.lower() if ev.severity else "low"
-            preview_items += f'<div class="preview-item"><span class="badge badge-{sev_class}" style="font-size:10px;padding:2px 6px;">{ev.severity}</span> {_esc(ev.title)}</div>'
-
-        cards += f"""
-        <a href="/view/{d.digest_date.isoformat()}" class="card" style="display:block;">
-          <div style="display:flex; justify-content:space-between; align-items:center;">
-            <h3>{d.digest_date.strftime('%B %d, %Y')}</h3>
-            <span class="badge badge-cat">{d.event_count} items</span>
-          </div>
-          <div class="meta">
-            Generated {d.generated_at.strftime('%H:%M UTC') if d.generated_at else 'N/A'}
-            {' &middot; Delivered via ' + ', '.join(d.delivery_channels) if d.delivery_channels else ''}
-          </div>
-          {overview_snippet}
-          <div class="preview-list">{preview_items}</div>
-        </a>"""
+    top_events_by_digest = await _preview_events(db, [d.digest_id for d in digests])
+
+    cards = "".join(
+        _render_digest_card(d, top_events_by_digest.get(d.digest_id, []), archive=True)
+        for d in digests
+    )
 
     if not cards:
         cards = '<p style="color:var(--text-muted);">No digests yet.</p>'
@@ -632,34 +481,60 @@ async def archive_page(db: AsyncSession = Depends(get_session)):
       <p style="color:var(--text-muted); margin-bottom: 32px;">All generated digests, newest first.</p>
       {cards}
     </div>"""
-    return HTMLResponse(_page("Archive", body))
+    return HTMLResponse(_store_page(("archive",), version, _page("Archive", body)), headers=headers)
 
 
 @router.get("/sources-ui", response_class=HTMLResponse)
-async def sources_page(db: AsyncSession = Depends(get_session)):
+async def sources_page(request: Request, db: AsyncSession = Depends(get_session)):
     """Sources dashboard page."""
+    # Fetches bump last_fetched_at; PATCH /sources/{id} and re-seeding bump
+    # updated_at
+    version = tuple((await db.execute(
+        select(
+            func.count(Source.source_id),
+            func.max(Source.last_fetched_at),
+            func.max(Source.updated_at),
+        )
+    )).one())
+    headers = {"etag": version_etag("sources", version), "cache-control": SOURCES_CACHE_CONTROL}
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    if (html := _cached_page(("sources",), version)) is not None:
+        return HTMLResponse(html, headers=headers)
+
     result = await db.execute(
-        select(Source).order_by(Source.company_slug, Source.source_name)
+        select(
+            Source.company_name,
+            Source.product_line,
+            Source.source_name,
+            Source.fetch_method,
+            Source.trust_tier,
+            Source.health_status,
+            Source.last_fetched_at,
+            Source.poll_frequency_min,
+            Source.priority,
+        ).order_by(Source.company_slug, Source.source_name)
     )
-    sources = result.scalars().all()
+    sources = result.all()
 
-    cards = ""
+    card_parts: list[str] = []
     for s in sources:
         status_color = "var(--low)" if s.health_status == "healthy" else "var(--high)" if s.health_status == "dead" else "var(--medium)"
         last_fetch = s.last_fetched_at.strftime('%b %d, %H:%M') if s.last_fetched_at else "Never"
-        cards += f"""
+        card_parts.append(f"""
         <div class="source-card">
-          <div class="company">{s.company_name}{(' / ' + s.product_line) if s.product_line else ''}</div>
-          <div class="name">{s.source_name}</div>
+          <div class="company">{_esc(s.company_name)}{(' / ' + _esc(s.product_line)) if s.product_line else ''}</div>
+          <div class="name">{_esc(s.source_name)}</div>
           <div class="details">
-            <span class="badge badge-tier">{s.fetch_method}</span>
+            <span class="badge badge-tier">{_esc(s.fetch_method)}</span>
             <span class="badge" style="background:rgba(0,212,170,0.12);color:var(--accent);">Tier {s.trust_tier}</span>
-            <span class="badge" style="background:rgba(0,0,0,0.2);color:{status_color};">● {s.health_status}</span>
+            <span class="badge" style="background:rgba(0,0,0,0.2);color:{status_color};">● {_esc(s.health_status)}</span>
           </div>
           <div class="details" style="margin-top:8px;">
-            Every {s.poll_frequency_min}min &middot; Priority: {s.priority} &middot; Last fetch: {last_fetch}
+            Every {s.poll_frequency_min}min &middot; Priority: {_esc(s.priority)} &middot; Last fetch: {last_fetch}
           </div>
-        </div>"""
+        </div>""")
+    cards = "".join(card_parts)
 
     body = f"""
     <div class="container">
@@ -667,35 +542,83 @@ async def sources_page(db: AsyncSession = Depends(get_session)):
       <p style="color:var(--text-muted); margin-bottom: 32px;">{len(sources)} sources configured.</p>
       <div class="source-grid">{cards}</div>
     </div>"""
-    return HTMLResponse(_page("Sources", body))
+    return HTMLResponse(_store_page(("sources",), version, _page("Sources", body)), headers=headers)
+
+
+# Display order of digest sections: (key, label, numbered cards, compact rows)
+SECTIONS: tuple[tuple[str, str, bool, bool], ...] = (
+    ("top5", "Top 5 — High Impact", True, False),
+    ("developer", "Developer Changes", False, False),
+    ("models", "Models & Capabilities", False, False),
+    ("pricing", "Pricing & Limits", False, False),
+    ("incidents", "Incidents & Reliability", False, False),
+    ("radar", "Community Radar", False, False),
+    ("everything_else", "Everything Else", False, True),
+)
+SECTION_LABELS = {key: label for key, label, _, _ in SECTIONS}
+# Position of each section in SECTIONS; NULL/unknown sections sort as the last
+_SECTION_POS = {key: pos for pos, key in enumerate(SECTION_LABELS)}
+_OTHER_POS = _SECTION_POS["everything_else"]
+
+
+def _section_pos(ev: UpdateEvent) -> int:
+    return _SECTION_POS.get(ev.digest_section, _OTHER_POS)
+
+
+def _group_events(events: list[UpdateEvent]) -> dict[str, list[UpdateEvent]]:
+    """Group events by their digest section.
+
+    Events arrive ordered by section position (see ``_load_digest_and_events``),
+    so each section is one contiguous run.
+    """
+    sections: dict[str, list[UpdateEvent]] = {key: [] for key in SECTION_LABELS}
+    for pos, run in groupby(events, key=_section_pos):
+        sections[SECTIONS[pos][0]].extend(run)
+    return sections
 
 
 async def _load_digest_and_events(
-    digest_date: date, db: AsyncSession
+    digest_date: date,
 ) -> tuple[Digest | None, list[UpdateEvent]]:
-    """Shared helper to load a digest and its events."""
-    stmt = select(Digest).where(Digest.digest_date == digest_date)
-    result = await db.execute(stmt)
-    digest = result.scalar_one_or_none()
-    if not digest:
-        return None, []
-    events_result = await db.execute(
-        select(UpdateEvent)
-        .where(UpdateEvent.digest_id == digest.digest_id)
-        .order_by(UpdateEvent.impact_score.desc())
-    )
-    events = list(events_result.scalars().all())
+    """Shared helper to load a digest and its events.
 
-    # Backfill summaries and fix garbage titles from raw content
-    raw_ids = [ev.raw_item_id for ev in events]
-    raw_result = await db.execute(
-        select(RawItem.raw_item_id, RawItem.content_text)
-        .where(RawItem.raw_item_id.in_(raw_ids))
+    The digest row and its events are both keyed off ``digest_date``, so
+    the two queries run concurrently.  Each event's raw item (content text
+    only) is eager-loaded in one batched SELECT.  Events come back in display
+    order — by section, then by impact — ready for ``_group_events``.
+    """
+    digest_id = (
+        select(Digest.digest_id)
+        .where(Digest.digest_date == digest_date)
+        .scalar_subquery()
     )
-    raw_texts = {row.raw_item_id: row.content_text for row in raw_result}
+
+    async def load_digest(s: AsyncSession) -> Digest | None:
+        return await s.scalar(select(Digest).where(Digest.digest_date == digest_date))
+
+    async def load_events(s: AsyncSession) -> list[UpdateEvent]:
+        result = await s.scalars(
+            select(UpdateEvent)
+            # Raw content is used to backfill summaries and fix garbage titles
+            .options(
+                selectinload(UpdateEvent.raw_item).load_only(RawItem.content_text)
+            )
+            .where(UpdateEvent.digest_id == digest_id)
+            .order_by(
+                case(_SECTION_POS, value=UpdateEvent.digest_section, else_=_OTHER_POS),
+                UpdateEvent.impact_score.desc(),
+            )
+        )
+        return list(result.all())
+
+    digest, events = await gather_sessions(load_digest, load_events)
+    if not digest:
+        return None, []
 
     for ev in events:
-        text = raw_texts.get(ev.raw_item_id) or ""
+        # Older rows may hold bare strings or partial dicts
+        ev.what_changed = normalize_what_changed(ev.what_changed)
+        text = ((ev.raw_item.content_text if ev.raw_item else None) or "")[:RAW_TEXT_SCAN_CHARS]
 
         # Fix garbage titles (just numbers/punctuation, e.g. GitHub trending star counts)
         if not _is_readable(ev.title):
@@ -731,209 +654,96 @@ async def _load_digest_and_events(
     return digest, events
 
 
-def _group_events(events: list[UpdateEvent]) -> dict[str, list[UpdateEvent]]:
-    """Group events by their digest section."""
-    sections: dict[str, list[UpdateEvent]] = {
-        "top5": [], "developer": [], "models": [],
-        "pricing": [], "incidents": [], "radar": [], "everything_else": [],
-    }
-    for ev in events:
-        sec = ev.digest_section or "everything_else"
-        if sec in sections:
-            sections[sec].append(ev)
-        else:
-            sections["everything_else"].append(ev)
-    return sections
-
-
-SECTION_LABELS = {
-    "top5": "Top 5 — High Impact",
-    "developer": "Developer Changes",
-    "models": "Models & Capabilities",
-    "pricing": "Pricing & Limits",
-    "incidents": "Incidents & Reliability",
-    "radar": "Community Radar",
-    "everything_else": "Everything Else",
-}
-
-
 @router.get("/view/{digest_date}", response_class=HTMLResponse)
 async def view_digest(
     digest_date: date,
+    request: Request,
     db: AsyncSession = Depends(get_session),
 ):
-    """View a full digest with all events rendered."""
-    digest, events = await _load_digest_and_events(digest_date, db)
+    """View a full digest with all events rendered.
+
+    The rendered page is cached until the digest is regenerated, and its
+    ETag (from ``generated_at``) lets browsers revalidate with a 304.  On a
+    miss it is streamed section by section; each chunk is rendered in the
+    threadpool rather than on the event loop.
+    """
+    generated_at = await db.scalar(
+        select(Digest.generated_at).where(Digest.digest_date == digest_date)
+    )
+    # Hand the connection back to the pool before loading and rendering
+    await db.close()
+    headers = {}
+    if generated_at is not None:
+        headers = {
+            "etag": version_etag("view", digest_date, generated_at, _CSS_VERSION, _CARD_VERSION),
+            "cache-control": VIEW_CACHE_CONTROL,
+        }
+        if is_not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
+    cache_key = ("view", digest_date)
+    if (html := _cached_page(cache_key, (generated_at,))) is not None:
+        return HTMLResponse(html, headers=headers)
+
+    digest, events = await _load_digest_and_events(digest_date)
 
     if not digest:
         return HTMLResponse(_page("Not Found", '<div class="container"><h2>Digest not found</h2><p><a href="/archive">Back to archive</a></p></div>'), status_code=404)
 
-    sections = _group_events(events)
-    all_categories = sorted({c for ev in events for c in (ev.categories or [])})
-
-    def _extract_domain(url: str) -> str:
-        """Extract a short domain label from a URL."""
-        try:
-            from urllib.parse import urlparse
-            host = urlparse(url).netloc
-            # Remove www. prefix
-            if host.startswith("www."):
-                host = host[4:]
-            return host
-        except Exception:
-            return url[:30]
-
-    def render_event(ev: UpdateEvent, numbered: int = 0) -> str:
-        sev_class = ev.severity.lower() if ev.severity else "low"
-        rank_html = f'<span class="rank">#{numbered}</span> ' if numbered else ""
-
-        # Tags row
-        tags = f'<span class="badge badge-{sev_class}">{ev.severity}</span>'
-        for c in (ev.categories or [])[:3]:
-            tags += f'<span class="badge badge-cat">{_esc(c)}</span>'
-        if ev.breaking_change:
-            tags += '<span class="badge badge-high">BREAKING</span>'
-
-        # Summary text — try dedicated fields, fall back to first what_changed fact
-        summary_text = _esc(ev.summary_short or ev.summary_medium or ev.why_it_matters or "")
-        if not summary_text and ev.what_changed and isinstance(ev.what_changed, list):
-            for item in ev.what_changed:
-                if isinstance(item, dict) and item.get("fact"):
-                    summary_text = _esc(item["fact"])
-                    break
-                elif isinstance(item, str) and item.strip():
-                    summary_text = _esc(item)
-                    break
-
-        # What changed
-        what_changed_html = ""
-        if ev.what_changed and isinstance(ev.what_changed, list):
-            items = ""
-            for item in ev.what_changed:
-                if isinstance(item, dict):
-                    fact = _esc(item.get("fact", ""))
-                    cite = item.get("citation_url", "")
-                    cite_link = f' <a href="{_esc(cite)}" target="_blank">[src]</a>' if cite else ""
-                    items += f"<li>{fact}{cite_link}</li>"
-                else:
-                    items += f"<li>{_esc(str(item))}</li>"
-            what_changed_html = f'<span class="label">What changed</span><ul>{items}</ul>'
-
-        # Why it matters
-        why_html = ""
-        if ev.why_it_matters:
-            why_html = f'<span class="label">Why it matters</span><p>{_esc(ev.why_it_matters)}</p>'
-
-        # Source links
-        source_links = ""
-        if ev.citations:
-            links = "".join(
-                f'<a href="{u}" target="_blank">{_extract_domain(u)}</a>'
-                for u in ev.citations
-            )
-            source_links = f'<div class="event-source-links">{links}</div>'
-
-        # Confidence + tier
-        meta_right = f'{ev.confidence} &middot; Tier {ev.trust_tier}'
-        if ev.published_at:
-            meta_right = ev.published_at.strftime('%b %d, %H:%M') + " &middot; " + meta_right
-
-        title = _esc(ev.title)
-        company = _esc(ev.company_name or "")
-        product = _esc(ev.product_line or "")
-
-        cats_attr = _esc("|".join(ev.categories or []))
+    uncached = [ev for ev in events if _card_is_stale(ev)]
+    parts: list[str] = []
+
+    def stream() -> Iterator[str]:
+        # Starlette pulls each chunk of a sync iterator in the threadpool
+        for chunk in _render_view(digest, events):
+            parts.append(chunk)
+            yield chunk
+        _store_page(cache_key, (digest.generated_at,), "".join(parts))
+
+    async def save_cards() -> None:
+        if fresh := [ev for ev in uncached if not _card_is_stale(ev)]:
+            await _save_event_cards(fresh)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/html",
+        headers=headers,
+        background=BackgroundTask(save_cards),
+    )
 
-        return f"""
-        <div class="event-card severity-{sev_class}" data-cats="{cats_attr}">
-          <div class="event-header">
-            <div class="event-title">{rank_html}{title}</div>
-          </div>
-          <div class="event-tags">{tags}</div>
-          <div class="event-company-line">{company}{(' / ' + product) if product else ''}</div>
-          {"<div class='event-summary'>" + summary_text + "</div>" if summary_text else ""}
-          <div class="event-body">{what_changed_html}{why_html}</div>
-          <div class="event-footer">
-            {source_links}
-            <span>{meta_right}</span>
-          </div>
-        </div>"""
-
-    def render_compact(ev: UpdateEvent) -> str:
-        sev_class = ev.severity.lower() if ev.severity else "low"
-        link = ""
-        if ev.citations:
-            link = f'<a href="{_esc(ev.citations[0])}" target="_blank">{_esc(_extract_domain(ev.citations[0]))}</a>'
-        summary = _esc(ev.summary_short or ev.summary_medium or ev.why_it_matters or "")
-        if not summary and ev.what_changed and isinstance(ev.what_changed, list):
-            for item in ev.what_changed:
-                if isinstance(item, dict) and item.get("fact"):
-                    summary = _esc(item["fact"])
-                    break
-                elif isinstance(item, str) and item.strip():
-                    summary = _esc(item)
-                    break
-        summary_html = f'<div class="ce-summary">{summary}</div>' if summary else ""
-        cats_attr = _esc("|".join(ev.categories or []))
-        return f"""
-        <div class="compact-event" data-cats="{cats_attr}">
-          <span class="badge badge-{sev_class}" style="flex-shrink:0;">{ev.severity}</span>
-          <span class="ce-company">{_esc(ev.company_name or "")}</span>
-          <div class="ce-content">
-            <span class="ce-title">{_esc(ev.title)}</span>
-            {summary_html}
-          </div>
-          {link}
-        </div>"""
 
-    # Build sections HTML
-    content = ""
-    section_order = ["top5", "developer", "models", "pricing", "incidents", "radar", "everything_else"]
+def _render_view(digest: Digest, events: list[UpdateEvent]) -> Iterator[str]:
+    """Render the full digest page as chunks (no I/O).
 
-    for idx, sec_key in enumerate(section_order, 1):
-        if not sections[sec_key]:
-            continue
-        label = f"[{idx}] {SECTION_LABELS[sec_key]}"
-        section_id = f"section-{sec_key}"
-        if sec_key == "everything_else":
-            items = "".join(render_compact(ev) for ev in sections[sec_key])
-            inner = f'<div class="card">{items}</div>'
-        elif sec_key == "top5":
-            items = "".join(render_event(ev, i + 1) for i, ev in enumerate(sections[sec_key]))
-            inner = items
-        else:
-            items = "".join(render_event(ev) for ev in sections[sec_key])
-            inner = items
-
-        content += f"""
-        <section class="section" data-section="{sec_key}">
-          <div class="section-header">
-            <div class="section-title">{label}</div>
-            <button class="section-toggle" data-target="{section_id}" aria-controls="{section_id}" aria-expanded="true">
-              <span class="chev">▾</span>
-            </button>
-          </div>
-          <div id="{section_id}" class="section-body">
-            <div class="section-inner">{inner}</div>
-          </div>
-        </section>"""
+    The page head and digest header come first, then one chunk per
+    section, so the browser can start on the stylesheet and layout before
+    the later sections are rendered.
+    """
+    digest_date = digest.digest_date
+    date_label = format_digest_date(digest_date)
+    sections = _group_events(events)
+    all_categories = sorted({c for ev in events for c in (ev.categories or [])})
 
     # Severity summary counts
-    high_ct = sum(1 for ev in events if ev.severity == "HIGH")
-    med_ct = sum(1 for ev in events if ev.severity == "MEDIUM")
-    low_ct = sum(1 for ev in events if ev.severity == "LOW")
+    # Events are already in memory; count severities in one pass
+    severity_counts = Counter(ev.severity for ev in events)
+    high_ct = severity_counts["HIGH"]
+    med_ct = severity_counts["MEDIUM"]
+    low_ct = severity_counts["LOW"]
 
     # Filter UI
-    filter_chips = "<button class='filter-chip active' data-filter='all'>All</button>"
-    for cat in all_categories:
-        filter_chips += f"<button class='filter-chip' data-filter='{_esc(cat)}'>{_esc(cat)}</button>"
+    # Each category is escaped once and reused for the attribute and the label
+    filter_chips = "<button class='filter-chip active' data-filter='all'>All</button>" + "".join(
+        f"<button class='filter-chip' data-filter='{cat}'>{cat}</button>"
+        for cat in map(_esc, all_categories)
+    )
 
-    body = f"""
+    yield _page_head(date_label)
+    yield f"""
     <div class="container">
       <div style="display:flex; justify-content:space-between; align-items:flex-start; flex-wrap:wrap; gap:16px; margin-bottom: 32px;">
         <div>
           <a href="/archive" style="font-size:13px;">&larr; Back to Archive</a>
-          <h2 style="margin-top:12px;">{digest_date.strftime('%B %d, %Y')}</h2>
+          <h2 style="margin-top:12px;">{date_label}</h2>
           <p style="color:var(--text-muted); margin-top:4px;">
             {digest.event_count} items &middot;
             <span class="badge badge-high">{high_ct} High</span>
@@ -950,12 +760,41 @@ async def view_digest(
       <div class="filter-bar" aria-label="Category filters">
         {filter_chips}
       </div>
-      {"<div class='card' style='border-left:3px solid var(--primary);'><p>" + _esc(digest.overview_text) + "</p></div>" if digest.overview_text else ""}
-      {content}
-    </div>"""
+      {"<div class='card' style='border-left:3px solid var(--primary);'><p>" + _esc(digest.overview_text, quote=False) + "</p></div>" if digest.overview_text else ""}
+      """
+
+    # Sections
+    for idx, (sec_key, sec_label, numbered, compact) in enumerate(SECTIONS, 1):
+        sec_events = sections[sec_key]
+        if not sec_events:
+            continue
+        label = f"[{idx}] {sec_label}"
+        section_id = f"section-{sec_key}"
+        if compact:
+            inner = f'<div class="card">{"".join(map(_render_compact, sec_events))}</div>'
+        else:
+            inner = "".join(
+                _event_card(ev, i if numbered else 0) for i, ev in enumerate(sec_events, 1)
+            )
 
-    # Add simple JS for collapsible sections + filters
-    script = """
+        yield f"""
+        <section class="section" data-section="{sec_key}">
+          <div class="section-header">
+            <div class="section-title">{label}</div>
+            <button class="section-toggle" data-target="{section_id}" aria-controls="{section_id}" aria-expanded="true">
+              <span class="chev">▾</span>
+            </button>
+          </div>
+          <div id="{section_id}" class="section-body">
+            <div class="section-inner">{inner}</div>
+          </div>
+        </section>"""
+
+    yield "\n    </div>" + _VIEW_SCRIPT + _PAGE_FOOT
+
+
+# Collapsible sections + category filters for the digest view
+_VIEW_SCRIPT = """
     <script>
     (function() {
       const sections = Array.from(document.querySelectorAll('.section'));
@@ -1012,72 +851,59 @@ async def view_digest(
     </script>
     """
 
-    return HTMLResponse(_page(digest_date.strftime('%B %d, %Y'), body + script))
-
 
 @router.get("/view/{digest_date}/download")
-async def download_digest_log(
-    digest_date: date,
-    db: AsyncSession = Depends(get_session),
-):
+async def download_digest_log(digest_date: date):
     """Generate and return a downloadable Markdown log of the digest."""
-    digest, events = await _load_digest_and_events(digest_date, db)
+    digest, events = await _load_digest_and_events(digest_date)
 
     if not digest:
         return PlainTextResponse("Digest not found.", status_code=404)
 
     sections = _group_events(events)
 
-    lines: list[str] = []
-    lines.append(f"# AI Daily Digest — {digest_date.strftime('%B %d, %Y')}")
-    lines.append(f"Generated: {digest.generated_at.strftime('%Y-%m-%d %H:%M UTC') if digest.generated_at else 'N/A'}")
-    lines.append(f"Total items: {digest.event_count}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# AI Daily Digest — {format_digest_date(digest_date)}\n")
+    w(f"Generated: {digest.generated_at.strftime('%Y-%m-%d %H:%M UTC') if digest.generated_at else 'N/A'}\n")
+    w(f"Total items: {digest.event_count}\n\n")
 
     if digest.overview_text:
-        lines.append("## Overview")
-        lines.append(digest.overview_text)
-        lines.append("")
-
-    section_order = ["top5", "developer", "models", "pricing", "incidents", "radar", "everything_else"]
+        w("## Overview\n")
+        w(digest.overview_text)
+        w("\n\n")
 
-    for idx, sec_key in enumerate(section_order, 1):
+    for idx, (sec_key, sec_label, numbered, _) in enumerate(SECTIONS, 1):
         if not sections[sec_key]:
             continue
-        lines.append(f"## [{idx}] {SECTION_LABELS[sec_key]}")
-        lines.append("")
+        w(f"## [{idx}] {sec_label}\n\n")
 
         for i, ev in enumerate(sections[sec_key], 1):
-            prefix = f"{i}. " if sec_key == "top5" else "- "
-            lines.append(f"{prefix}**{ev.title}**")
-            lines.append(f"  Company: {ev.company_name}{(' / ' + ev.product_line) if ev.product_line else ''}")
-            lines.append(f"  Severity: {ev.severity} | Score: {ev.impact_score:.1f} | Confidence: {ev.confidence}")
+            prefix = f"{i}. " if numbered else "- "
+            w(f"{prefix}**{ev.title}**\n")
+            w(f"  Company: {ev.company_name}{(' / ' + ev.product_line) if ev.product_line else ''}\n")
+            w(f"  Severity: {ev.severity} | Score: {ev.impact_score:.1f} | Confidence: {ev.confidence}\n")
             if ev.categories:
-                lines.append(f"  Categories: {', '.join(ev.categories)}")
+                w(f"  Categories: {', '.join(ev.categories)}\n")
 
-            if ev.what_changed and isinstance(ev.what_changed, list):
-                lines.append("  What changed:")
+            if ev.what_changed:
+                w("  What changed:\n")
                 for item in ev.what_changed:
-                    if isinstance(item, dict):
-                        fact = item.get("fact", "")
-                        cite = item.get("citation_url", "")
-                        cite_str = f" ({cite})" if cite else ""
-                        lines.append(f"    - {fact}{cite_str}")
-                    else:
-                        lines.append(f"    - {item}")
+                    cite = item["citation_url"]
+                    w(f"    - {item['fact']}{f' ({cite})' if cite else ''}\n")
 
             if ev.why_it_matters:
-                lines.append(f"  Why it matters: {ev.why_it_matters}")
+                w(f"  Why it matters: {ev.why_it_matters}\n")
 
             if ev.citations:
-                lines.append(f"  Sources: {', '.join(ev.citations)}")
+                w(f"  Sources: {', '.join(ev.citations)}\n")
 
-            lines.append("")
+            w("\n")
 
-    lines.append("---")
-    lines.append("AI Daily Digest — automated, citation-backed AI industry updates.")
+    w("---\n")
+    w("AI Daily Digest — automated, citation-backed AI industry updates.")
 
-    content = "\n".join(lines)
+    content = buf.getvalue()
     filename = f"ai-digest-{digest_date.isoformat()}.md"
 
     return PlainTextResponse(
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timezone
 
 import httpx
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_digest.connectors.base import BaseConnector, RawItemData
@@ -13,6 +14,15 @@ from ai_digest.models.source import Source
 
 logger = logging.getLogger(__name__)
 
+HN_ITEM_URL = "https://news.ycombinator.com/item?id="
+
+# Scalar JSON value types copied into generic-record metadata (orjson yields
+# exact types, so a set membership test replaces isinstance)
+_METADATA_TYPES = frozenset((str, int, float, bool))
+
+# Keys probed, in order, for the record list when parse_rules has no items_key
+_COMMON_ITEMS_KEYS = ("results", "items", "data", "posts", "hits")
+
 
 class APIPollConnector(BaseConnector):
     """Poll a JSON API endpoint and extract items.
@@ -38,7 +48,7 @@ class APIPollConnector(BaseConnector):
             logger.warning("API poll %s returned %d", source.source_url, resp.status_code)
             return []
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         # Detect API type and route to the right parser
         if "hn.algolia.com" in source.source_url:
@@ -51,7 +61,11 @@ class APIPollConnector(BaseConnector):
 
 
 def _parse_hn_results(data: dict, source: Source) -> list[RawItemData]:
-    """Parse Hacker News Algolia API search results."""
+    """Parse Hacker News Algolia API search results.
+
+    Algolia's hit schema is fixed, so items are built with
+    ``model_construct`` (no per-field validation).
+    """
     hits = data.get("hits", [])
     items: list[RawItemData] = []
 
@@ -60,16 +74,16 @@ def _parse_hn_results(data: dict, source: Source) -> list[RawItemData]:
         published_at = None
         if created_at_str:
             try:
-                published_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+                published_at = datetime.fromisoformat(created_at_str)
             except ValueError:
                 pass
 
-        story_url = hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}"
+        hn_url = HN_ITEM_URL + str(hit.get("objectID", ""))
 
         items.append(
-            RawItemData(
+            RawItemData.model_construct(
                 external_id=hit.get("objectID"),
-                url=story_url,
+                url=hit.get("url") or hn_url,
                 title=hit.get("title"),
                 content_text=hit.get("story_text") or hit.get("comment_text"),
                 published_at=published_at,
@@ -77,7 +91,7 @@ def _parse_hn_results(data: dict, source: Source) -> list[RawItemData]:
                     "points": hit.get("points", 0),
                     "num_comments": hit.get("num_comments", 0),
                     "author": hit.get("author"),
-                    "hn_url": f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}",
+                    "hn_url": hn_url,
                 },
             )
         )
@@ -97,13 +111,10 @@ def _parse_generic_json(data: dict | list, source: Source) -> list[RawItemData]:
     elif items_key and isinstance(data, dict):
         records = data.get(items_key, [])
     elif isinstance(data, dict):
-        # Try common keys
-        for key in ("results", "items", "data", "posts", "hits"):
-            if key in data and isinstance(data[key], list):
-                records = data[key]
-                break
-        else:
-            records = [data]
+        records = next(
+            (v for k in _COMMON_ITEMS_KEYS if isinstance(v := data.get(k), list)),
+            [data],
+        )
     else:
         records = []
 
@@ -113,6 +124,7 @@ def _parse_generic_json(data: dict | list, source: Source) -> list[RawItemData]:
     id_field = parse_rules.get("id_field", "id")
     content_field = parse_rules.get("content_field", "description")
     date_field = parse_rules.get("date_field", "created_at")
+    mapped_fields = frozenset((url_field, title_field, id_field, content_field, date_field))
 
     items: list[RawItemData] = []
     for record in records:
@@ -123,7 +135,7 @@ def _parse_generic_json(data: dict | list, source: Source) -> list[RawItemData]:
         raw_date = record.get(date_field)
         if isinstance(raw_date, str):
             try:
-                published_at = datetime.fromisoformat(raw_date.replace("Z", "+00:00"))
+                published_at = datetime.fromisoformat(raw_date)
             except ValueError:
                 pass
 
@@ -136,8 +148,7 @@ def _parse_generic_json(data: dict | list, source: Source) -> list[RawItemData]:
                 published_at=published_at,
                 metadata={
                     k: v for k, v in record.items()
-                    if k not in {url_field, title_field, id_field, content_field, date_field}
-                    and isinstance(v, (str, int, float, bool))
+                    if k not in mapped_fields and type(v) in _METADATA_TYPES
                 },
             )
         )
@@ -4,18 +4,81 @@ from __future__ import annotations
 
 import hashlib
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ai_digest.config import settings
 from ai_digest.models.source import Source
 
 
+def _content_hasher(algo: str) -> Callable[..., Any]:
+    """Hash constructor for content dedup keys.
+
+    These digests only detect repeated content; they are not MACs.  Both
+    choices give 32 bytes.  BLAKE3 is faster on large bodies but needs the
+    optional ``blake3`` package, and switching algorithms on an existing
+    database means old rows no longer match new items.
+    """
+    if algo == "blake3":
+        from blake3 import blake3
+
+        return blake3
+    if algo == "sha256":
+        return hashlib.sha256
+    raise ValueError(f"Unknown content_hash_algo: {algo!r}")
+
+
+_new_content_hash = _content_hasher(settings.content_hash_algo)
+
+
+def content_digest(data: bytes) -> bytes:
+    """32-byte dedup digest of ``data`` using ``settings.content_hash_algo``."""
+    return _new_content_hash(data).digest()
+
+
+def conditional_headers(source: Source) -> dict[str, str]:
+    """If-None-Match / If-Modified-Since from the validators of the last fetch."""
+    parse_rules = source.parse_rules or {}
+    headers: dict[str, str] = {}
+    if etag := parse_rules.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := parse_rules.get("last_modified"):
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def remember_validators(source: Source, resp: httpx.Response) -> None:
+    """Keep the response's ETag / Last-Modified in ``source.parse_rules``.
+
+    The dict is replaced rather than mutated so the JSONB change is flushed
+    with the fetch job's commit.
+    """
+    etag = resp.headers.get("etag")
+    last_modified = resp.headers.get("last-modified")
+    parse_rules = source.parse_rules or {}
+    if (etag, last_modified) == (parse_rules.get("etag"), parse_rules.get("last_modified")):
+        return
+    updated = {**parse_rules, "etag": etag, "last_modified": last_modified}
+    source.parse_rules = {k: v for k, v in updated.items() if v is not None}
+
+
 class RawItemData(BaseModel):
-    """Pydantic data class returned by connectors (not persisted directly)."""
+    """Pydantic data class returned by connectors (not persisted directly).
+
+    Items are read-only once built, so the cached ``content_hash`` cannot go
+    stale.  Connectors reading a fixed-schema API (and the pipeline, which
+    rebuilds items from stored rows) use ``model_construct`` to skip
+    validation; free-form sources such as feeds and generic JSON go through
+    the normal constructor.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     external_id: str | None = None
     url: str
@@ -25,11 +88,17 @@ class RawItemData(BaseModel):
     published_at: datetime | None = None
     metadata: dict[str, Any] = {}
 
-    @property
-    def content_hash(self) -> str:
-        """SHA-256 hash of normalised content for dedup."""
-        payload = (self.url + (self.content_text or self.title or "")).encode()
-        return hashlib.sha256(payload).hexdigest()
+    @cached_property
+    def content_hash(self) -> bytes:
+        """Digest (32 raw bytes) of url + content for dedup.
+
+        Computed once per item.  The parts are fed to the hash separately,
+        so the body is never concatenated into a second large string.
+        """
+        h = _new_content_hash()
+        h.update(self.url.encode())
+        h.update((self.content_text or self.title or "").encode())
+        return h.digest()
 
 
 class BaseConnector(ABC):
@@ -16,16 +16,21 @@ _CONNECTOR_MAP: dict[str, type[BaseConnector]] = {
     "social_api": RSSConnector,  # Reddit RSS is handled by RSSConnector
 }
 
+# Connectors hold no per-instance state, so one shared instance per method
+_CONNECTOR_INSTANCES: dict[str, BaseConnector] = {
+    method: cls() for method, cls in _CONNECTOR_MAP.items()
+}
+
 
 def connector_for_source(fetch_method: str) -> BaseConnector:
-    """Return an instantiated connector for the given fetch_method.
+    """Return the (shared) connector for the given fetch_method.
 
     Raises ValueError if the method is not supported.
     """
-    cls = _CONNECTOR_MAP.get(fetch_method)
-    if cls is None:
+    try:
+        return _CONNECTOR_INSTANCES[fetch_method]
+    except KeyError:
         raise ValueError(
             f"Unknown fetch_method {fetch_method!r}. "
             f"Supported: {', '.join(_CONNECTOR_MAP)}"
-        )
-    return cls()
+        ) from None
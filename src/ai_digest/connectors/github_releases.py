@@ -6,10 +6,16 @@ import logging
 from datetime import datetime, timezone
 
 import httpx
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_digest.config import settings
-from ai_digest.connectors.base import BaseConnector, RawItemData
+from ai_digest.connectors.base import (
+    BaseConnector,
+    RawItemData,
+    conditional_headers,
+    remember_validators,
+)
 from ai_digest.models.source import Source
 
 logger = logging.getLogger(__name__)
@@ -31,8 +37,10 @@ class GitHubReleasesConnector(BaseConnector):
             logger.warning("Cannot parse GitHub owner/repo from %s", source.source_url)
             return []
 
+        # 304s for an unchanged ETag don't count against the rate limit
         headers: dict[str, str] = {
             "Accept": "application/vnd.github+json",
+            **conditional_headers(source),
         }
         if settings.github_token:
             headers["Authorization"] = f"Bearer {settings.github_token}"
@@ -46,11 +54,17 @@ class GitHubReleasesConnector(BaseConnector):
             logger.warning("GitHub API failed for %s: %s", owner_repo, exc)
             return []
 
+        if resp.status_code == 304:
+            logger.debug("GitHub API %s not modified (304)", owner_repo)
+            return []
+
         if resp.status_code >= 400:
             logger.warning("GitHub API %s returned %d", owner_repo, resp.status_code)
             return []
 
-        releases = resp.json()
+        remember_validators(source, resp)
+
+        releases = orjson.loads(resp.content)
         if not isinstance(releases, list):
             logger.warning("GitHub API %s unexpected response type", owner_repo)
             return []
@@ -61,12 +75,12 @@ class GitHubReleasesConnector(BaseConnector):
             published_at = None
             if published_str:
                 try:
-                    published_at = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
+                    published_at = datetime.fromisoformat(published_str)
                 except ValueError:
                     pass
 
             items.append(
-                RawItemData(
+                RawItemData.model_construct(
                     external_id=str(rel.get("id", "")),
                     url=rel.get("html_url", source.source_url),
                     title=rel.get("name") or rel.get("tag_name", ""),
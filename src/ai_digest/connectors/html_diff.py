@@ -2,24 +2,36 @@
 
 from __future__ import annotations
 
-import difflib
+import asyncio
 import hashlib
 import logging
 import re
-import uuid
 from datetime import datetime, timezone
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ai_digest.connectors.base import BaseConnector, RawItemData
+from ai_digest.connectors.base import (
+    BaseConnector,
+    RawItemData,
+    conditional_headers,
+    content_digest,
+    remember_validators,
+)
+from ai_digest.ids import uuid7
 from ai_digest.models.snapshot import Snapshot
 from ai_digest.models.source import Source
 
 logger = logging.getLogger(__name__)
 
+# Never part of the visible page text
+_NON_TEXT_TAGS = ["script", "style", "template"]
+# Snapshots keep an 8-byte digest per text line instead of the text itself;
+# collisions at this size are negligible for one page's lines
+LINE_HASH_SIZE = 8
+
 
 class HTMLDiffConnector(BaseConnector):
     """Fetch an HTML page, diff against the previous snapshot, yield changed sections."""
@@ -31,58 +43,72 @@ class HTMLDiffConnector(BaseConnector):
         db: AsyncSession,
     ) -> list[RawItemData]:
         try:
-            resp = await http_client.get(source.source_url, timeout=30)
+            resp = await http_client.get(
+                source.source_url, headers=conditional_headers(source), timeout=30
+            )
         except httpx.HTTPError as exc:
             logger.warning("HTML fetch failed for %s: %s", source.source_url, exc)
             return []
 
+        if resp.status_code == 304:
+            logger.debug("HTML %s not modified (304)", source.source_url)
+            return []
+
         if resp.status_code >= 400:
             logger.warning("HTML %s returned %d", source.source_url, resp.status_code)
             return []
 
-        html = resp.text
-        content_hash = hashlib.sha256(html.encode()).hexdigest()
+        remember_validators(source, resp)
+
+        # Hash the body as received; it is only decoded if the page changed
+        content_hash = content_digest(resp.content)
 
-        # Get previous snapshot
+        # Latest snapshot's hash only (backward scan of idx_snapshots_source);
+        # its stored lines are read only once the page is known to differ
         prev_stmt = (
-            select(Snapshot)
+            select(Snapshot.snapshot_id, Snapshot.content_hash)
             .where(Snapshot.source_id == source.source_id)
             .order_by(Snapshot.fetched_at.desc())
             .limit(1)
         )
-        result = await db.execute(prev_stmt)
-        prev_snapshot = result.scalar_one_or_none()
+        prev_snapshot = (await db.execute(prev_stmt)).first()
 
         # If same hash as previous, no changes
         if prev_snapshot and prev_snapshot.content_hash == content_hash:
             logger.debug("HTML %s unchanged", source.source_url)
             return []
 
-        # Extract text from HTML
-        soup = BeautifulSoup(html, "html.parser")
-        parse_rules = source.parse_rules or {}
-        css_selector = parse_rules.get("css_selector")
-
-        if css_selector:
-            target = soup.select_one(css_selector)
-            current_text = target.get_text("\n", strip=True) if target else soup.get_text("\n", strip=True)
-        else:
-            current_text = soup.get_text("\n", strip=True)
+        prev_hashes: bytes | None = None
+        if prev_snapshot:
+            prev = (await db.execute(
+                select(Snapshot.line_hashes, Snapshot.diff_from_prev)
+                .where(Snapshot.snapshot_id == prev_snapshot.snapshot_id)
+            )).one()
+            prev_hashes = prev.line_hashes
+            if prev_hashes is None:
+                # Snapshot stored before line hashes: derive them from its text
+                prev_hashes = await asyncio.to_thread(_line_hashes, prev.diff_from_prev or "")
+
+        # Parsing and diffing a large page is CPU-bound; keep it off the loop
+        # so other connectors' requests proceed meanwhile
+        line_hashes, added_lines = await asyncio.to_thread(
+            _extract_changes, resp.text, (source.parse_rules or {}).get("css_selector"), prev_hashes
+        )
 
-        # Compute diff if we have a previous snapshot
-        diff_text: str | None = None
-        if prev_snapshot and prev_snapshot.diff_from_prev is not None:
-            # We stored previous text in diff_from_prev as the full text last time
-            pass
+        # Markup churn (ads, timestamps, nonces) with the same visible text:
+        # keep the previous snapshot instead of storing an identical copy
+        if prev_snapshot and prev_hashes == line_hashes:
+            logger.debug("HTML %s text unchanged despite hash diff", source.source_url)
+            return []
 
         # Store new snapshot
         new_snapshot = Snapshot(
-            snapshot_id=uuid.uuid4(),
+            snapshot_id=uuid7(),
             source_id=source.source_id,
-            s3_key=f"snapshots/{source.source_id}/{content_hash}.html",
+            s3_key=f"snapshots/{source.source_id}/{content_hash.hex()}.html",
             content_hash=content_hash,
             fetched_at=datetime.now(timezone.utc),
-            diff_from_prev=current_text,  # store full text for next diff
+            line_hashes=line_hashes,  # compared against by the next fetch
             has_changes=True,
         )
         db.add(new_snapshot)
@@ -93,27 +119,8 @@ class HTMLDiffConnector(BaseConnector):
             logger.info("HTML %s first snapshot stored (baseline)", source.source_url)
             return []
 
-        # Compute diff between previous text and current text
-        prev_text = prev_snapshot.diff_from_prev or ""
-        diff_lines = list(
-            difflib.unified_diff(
-                prev_text.splitlines(),
-                current_text.splitlines(),
-                lineterm="",
-                n=2,
-            )
-        )
-
-        if not diff_lines:
-            logger.debug("HTML %s text unchanged despite hash diff", source.source_url)
-            return []
-
-        # Extract added lines as the "changes"
-        added_lines = [
-            line[1:] for line in diff_lines
-            if line.startswith("+") and not line.startswith("+++")
-        ]
         if not added_lines:
+            logger.debug("HTML %s has no new lines despite hash diff", source.source_url)
             return []
 
         change_text = "\n".join(added_lines)
@@ -123,8 +130,48 @@ class HTMLDiffConnector(BaseConnector):
         return items
 
 
+def _line_hashes(text: str) -> bytes:
+    """Concatenated ``LINE_HASH_SIZE``-byte digests of each line of ``text``."""
+    return b"".join(
+        hashlib.blake2b(line.encode(), digest_size=LINE_HASH_SIZE).digest()
+        for line in text.splitlines()
+    )
+
+
+def _extract_changes(
+    html: str, css_selector: str | None, prev_hashes: bytes | None
+) -> tuple[bytes, list[str]]:
+    """Line hashes of the page text, plus the lines absent from ``prev_hashes``.
+
+    Only new lines become items, so no alignment (difflib) is needed: the
+    current lines are kept, in page order, when the previous snapshot had no
+    line with the same hash.  Without a baseline no lines are returned.
+    """
+    lines = _page_text(html, css_selector).splitlines()
+    hashes = [hashlib.blake2b(line.encode(), digest_size=LINE_HASH_SIZE).digest() for line in lines]
+    line_hashes = b"".join(hashes)
+    if prev_hashes is None:
+        return line_hashes, []
+    seen = {
+        prev_hashes[i:i + LINE_HASH_SIZE]
+        for i in range(0, len(prev_hashes), LINE_HASH_SIZE)
+    }
+    return line_hashes, [line for line, h in zip(lines, hashes) if h not in seen]
+
+
+def _page_text(html: str, css_selector: str | None = None) -> str:
+    """Visible text of ``html`` (or of the first ``css_selector`` match), one line per node."""
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(_NON_TEXT_TAGS)
+    node = (tree.css_first(css_selector) if css_selector else None) or tree.root
+    if node is None:
+        return ""
+    return node.text(separator="\n", strip=True)
+
+
 _REPO_RE = re.compile(r"([\w.-]+)\s*/\s*([\w.-]+)")
 _ALPHA_RE = re.compile(r"[A-Za-z]{2,}")
+_STAR_COUNT_RE = re.compile(r"[\d,\s]+")
 
 
 def _extract_title(block: str) -> str:
@@ -156,7 +203,7 @@ def _looks_like_star_count(text: str) -> bool:
     lower = text.lower()
     if "stars today" in lower:
         return True
-    return bool(re.fullmatch(r"[\d,\s]+", text.strip()))
+    return bool(_STAR_COUNT_RE.fullmatch(text.strip()))
 
 
 def _split_changes_into_items(change_text: str, source: Source) -> list[RawItemData]:
@@ -172,7 +219,8 @@ def _split_changes_into_items(change_text: str, source: Source) -> list[RawItemD
         return []
 
     items: list[RawItemData] = []
-    for i, block in enumerate(blocks):
+    now = datetime.now(timezone.utc)
+    for block in blocks:
         title = _extract_title(block)
         if _looks_like_star_count(title) or _looks_like_star_count(block):
             continue
@@ -180,11 +228,13 @@ def _split_changes_into_items(change_text: str, source: Source) -> list[RawItemD
             continue
         items.append(
             RawItemData(
+                # Stored ids use this sha256 prefix; another hash would make
+                # every known block look new once
                 external_id=hashlib.sha256(block.encode()).hexdigest()[:16],
                 url=source.source_url,
                 title=title,
                 content_text=block,
-                published_at=datetime.now(timezone.utc),
+                published_at=now,
             )
         )
 
@@ -3,18 +3,29 @@
 from __future__ import annotations
 
 import logging
+import re
+from calendar import timegm
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 import feedparser
 import httpx
+from selectolax.lexbor import LexborHTMLParser
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ai_digest.connectors.base import BaseConnector, RawItemData
+from ai_digest.connectors.base import (
+    BaseConnector,
+    RawItemData,
+    conditional_headers,
+    remember_validators,
+)
 from ai_digest.models.source import Source
 
 logger = logging.getLogger(__name__)
 
+_NON_TEXT_TAGS = ["script", "style", "template"]
+_WS_RE = re.compile(r"\s+")
+
 
 class RSSConnector(BaseConnector):
     """Fetch and parse RSS/Atom feeds."""
@@ -25,14 +36,8 @@ class RSSConnector(BaseConnector):
         http_client: httpx.AsyncClient,
         db: AsyncSession,
     ) -> list[RawItemData]:
-        headers: dict[str, str] = {}
-        parse_rules = source.parse_rules or {}
-
         # Conditional fetch using ETag / Last-Modified from parse_rules
-        if etag := parse_rules.get("etag"):
-            headers["If-None-Match"] = etag
-        if last_modified := parse_rules.get("last_modified"):
-            headers["If-Modified-Since"] = last_modified
+        headers = conditional_headers(source)
 
         try:
             resp = await http_client.get(source.source_url, headers=headers, timeout=30)
@@ -48,6 +53,8 @@ class RSSConnector(BaseConnector):
             logger.warning("RSS %s returned %d", source.source_url, resp.status_code)
             return []
 
+        remember_validators(source, resp)
+
         feed = feedparser.parse(resp.text)
 
         items: list[RawItemData] = []
@@ -70,29 +77,29 @@ class RSSConnector(BaseConnector):
 
 
 def _parse_date(entry) -> datetime | None:
-    """Try to extract a timezone-aware datetime from a feed entry."""
+    """Try to extract a timezone-aware datetime from a feed entry.
+
+    feedparser already parsed the date into a UTC ``struct_time`` when it
+    could; the raw string is only parsed when it could not.
+    """
     for field in ("published", "updated"):
-        raw = entry.get(field)
-        if not raw:
-            continue
-        try:
-            return parsedate_to_datetime(raw)
-        except Exception:
-            pass
-        # feedparser parsed struct
         parsed = entry.get(f"{field}_parsed")
         if parsed:
             try:
-                from time import mktime
-                return datetime.fromtimestamp(mktime(parsed), tz=timezone.utc)
-            except Exception:
+                return datetime.fromtimestamp(timegm(parsed), tz=timezone.utc)
+            except (OverflowError, OSError, ValueError):
+                pass
+        raw = entry.get(field)
+        if raw:
+            try:
+                return parsedate_to_datetime(raw)
+            except (TypeError, ValueError):
                 pass
     return None
 
 
 def _extract_content(entry) -> str | None:
     """Get plain-text content from feed entry, stripping HTML tags."""
-    import re
     raw = None
     # Prefer summary, fall back to content
     if summary := entry.get("summary"):
@@ -103,9 +110,11 @@ def _extract_content(entry) -> str | None:
             raw = content_list[0].get("value")
     if not raw:
         return None
-    # Strip HTML tags — RSS feeds (esp. Reddit) embed raw HTML
-    clean = re.sub(r"<[^>]+>", " ", raw)
-    return re.sub(r"\s+", " ", clean).strip() or raw
+    # RSS feeds (esp. Reddit) embed raw HTML; parse it for text (entities decoded)
+    tree = LexborHTMLParser(raw)
+    tree.strip_tags(_NON_TEXT_TAGS)
+    clean = tree.root.text(separator=" ", strip=True) if tree.root else ""
+    return _WS_RE.sub(" ", clean).strip() or raw
 
 
 def _extract_html(entry) -> str | None:
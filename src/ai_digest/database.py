@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from ai_digest.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Dispose the pool after this many consecutive failed background pings
+REAPER_MAX_FAILURES = 2
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.log_level == "DEBUG",
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_s,
+    # No per-checkout ping on the request path; connection_reaper() below
+    # detects dead connections in the background instead.
+    pool_pre_ping=False,
+    pool_recycle=settings.db_pool_recycle_s,
+    connect_args={
+        # asyncpg's own server-side prepared statement cache (per connection)
+        "statement_cache_size": 1024,
+        # SQLAlchemy's asyncpg adapter cache of prepared statement handles
+        "prepared_statement_cache_size": 256,
+        "server_settings": {
+            "application_name": "ai_digest",
+            # Queries here are short index lookups; JIT compile time would dominate
+            "jit": "off",
+        },
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -29,3 +56,70 @@ async def get_session() -> AsyncSession:  # type: ignore[misc]
     """Yield an async DB session (for use as FastAPI dependency)."""
     async with async_session_factory() as session:
         yield session
+
+
+async def gather_sessions(*work: Callable[[AsyncSession], Awaitable[Any]]) -> list[Any]:
+    """Run independent read-only queries concurrently, one session each.
+
+    A single AsyncSession runs its statements one at a time on one
+    connection.  Giving each unit of work its own short-lived session lets
+    their round trips overlap.  Each callable should return fully
+    materialised results (lists or scalars), not live Result objects.
+    """
+    async def _run(fn: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with async_session_factory() as session:
+            return await fn(session)
+
+    return list(await asyncio.gather(*(_run(fn) for fn in work)))
+
+
+async def approx_row_count(db: AsyncSession, table: str) -> int:
+    """Return the planner's row estimate for ``table`` from ``pg_class``.
+
+    ``reltuples`` is refreshed by VACUUM/ANALYZE (autovacuum), so this is an
+    O(1) catalog lookup rather than a ``count(*)`` scan.  For a partitioned
+    table the estimates of its partitions are summed (the parent has no
+    storage).  Relations that were never analyzed report -1, clamped to 0.
+    """
+    estimate = await db.scalar(
+        text(
+            "SELECT sum(greatest(c.reltuples, 0))::bigint FROM pg_class c "
+            "WHERE c.oid = to_regclass(:t) OR c.oid IN "
+            "(SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(:t))"
+        ),
+        {"t": table},
+    )
+    return estimate or 0
+
+
+async def warm_pool() -> None:
+    """Open ``pool_size`` connections up front so early requests skip connect."""
+    async def _touch() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_touch() for _ in range(engine.pool.size())))
+
+
+async def connection_reaper(interval: float | None = None) -> None:
+    """Ping the pool periodically; dispose it after repeated failures.
+
+    Runs as a background task for the life of the app.  After a database
+    restart or failover, stale connections are dropped here instead of
+    surfacing as errors on the next request.
+    """
+    interval = interval or settings.db_ping_interval_s
+    failures = 0
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            failures = 0
+        except Exception as exc:
+            failures += 1
+            logger.warning("DB ping failed (%d in a row): %s", failures, exc)
+            if failures >= REAPER_MAX_FAILURES:
+                await engine.dispose()
+                logger.warning("Disposed DB connection pool after repeated ping failures")
+                failures = 0
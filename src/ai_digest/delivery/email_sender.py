@@ -11,6 +11,7 @@ import aiosmtplib
 import resend
 
 from ai_digest.config import settings
+from ai_digest.digest.renderer import format_digest_date
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ async def send_digest_email(
         logger.warning("No email recipients configured, skipping send")
         return False
 
-    subject = f"AI Daily Digest — {digest_date.strftime('%B %d, %Y')}"
+    subject = f"AI Daily Digest — {format_digest_date(digest_date)}"
 
     if settings.resend_api_key:
         return await _send_via_resend(subject, html_content, to_addrs)
@@ -69,24 +70,38 @@ async def _send_via_smtp(
     html: str,
     to_addrs: list[str],
 ) -> bool:
-    """Send email via SMTP as fallback."""
+    """Send email via SMTP as fallback.
+
+    Each recipient gets their own copy (only their address in ``To:``), all
+    over one authenticated connection. The message is built once and only
+    the ``To:`` header is swapped between sends.
+    """
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
     msg["From"] = settings.digest_email_from
-    msg["To"] = ", ".join(to_addrs)
     msg.attach(MIMEText(html, "html"))
 
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.smtp_host,
+        port=settings.smtp_port,
+        username=settings.smtp_user,
+        password=settings.smtp_password,
+        use_tls=True,
+    )
+    sent = 0
     try:
-        await aiosmtplib.send(
-            msg,
-            hostname=settings.smtp_host,
-            port=settings.smtp_port,
-            username=settings.smtp_user,
-            password=settings.smtp_password,
-            use_tls=True,
-        )
-        logger.info("Email sent via SMTP to %d recipients", len(to_addrs))
-        return True
+        async with smtp:
+            for addr in to_addrs:
+                del msg["To"]
+                msg["To"] = addr
+                try:
+                    await smtp.send_message(msg)
+                    sent += 1
+                except aiosmtplib.SMTPRecipientsRefused as exc:
+                    logger.warning("SMTP refused %s: %s", addr, exc)
     except Exception as exc:
-        logger.error("SMTP send failed: %s", exc)
-        return False
+        logger.error("SMTP send failed after %d of %d recipients: %s", sent, len(to_addrs), exc)
+        return sent > 0
+
+    logger.info("Email sent via SMTP to %d of %d recipients", sent, len(to_addrs))
+    return sent > 0
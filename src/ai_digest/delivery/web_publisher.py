@@ -3,55 +3,120 @@
 from __future__ import annotations
 
 import logging
+import os
 from datetime import date
 from pathlib import Path
 
+import orjson
+
 from ai_digest.config import settings
-from ai_digest.digest.renderer import render_archive
+from ai_digest.digest.renderer import format_digest_date, render_archive
 
 logger = logging.getLogger(__name__)
 
+# Published digests, newest first: [{"date_iso", "event_count", "url"}, ...].
+# Kept up to date by publish_web_digest so the archive never re-globs.
+ARCHIVE_INDEX = "archive.json"
+
+
+def _write_atomic(path: Path, text: str | bytes) -> None:
+    """Replace ``path`` with ``text`` so readers never see a partial file.
+
+    The temp file lives in the same directory (same filesystem, so
+    ``os.replace`` is a rename) and is hidden from the ``digest-*`` glob.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(text.encode("utf-8") if isinstance(text, str) else text)
+    os.replace(tmp, path)
+
+
+def _scan_digest_files(output_dir: Path) -> list[dict]:
+    """Archive entries for the digest pages on disk (no event counts)."""
+    entries = []
+    for f in sorted(output_dir.glob("digest-*.html"), reverse=True):
+        # Extract date from filename: digest-YYYY-MM-DD.html
+        date_str = f.stem.replace("digest-", "")
+        try:
+            d = date.fromisoformat(date_str)
+        except ValueError:
+            continue
+        entries.append({
+            "date_iso": d.isoformat(),
+            "event_count": None,
+            "url": f"/digests/{d.isoformat()}",
+        })
+    return entries
+
+
+def _load_archive_entries(output_dir: Path) -> list[dict]:
+    """Entries from the archive index, seeded from the files if it is missing."""
+    index = output_dir / ARCHIVE_INDEX
+    try:
+        return orjson.loads(index.read_bytes())
+    except FileNotFoundError:
+        return _scan_digest_files(output_dir)
+    except orjson.JSONDecodeError:
+        logger.warning("Unreadable %s, rebuilding it from digest files", index)
+        return _scan_digest_files(output_dir)
+
 
 async def publish_web_digest(
     digest_date: date,
     web_html: str,
+    event_count: int | None = None,
 ) -> str:
     """Write the rendered digest HTML to the web output directory.
 
-    Returns the relative URL path for the published page.
+    Also records the digest in the archive index.  Returns the relative URL
+    path for the published page.
     """
     output_dir = Path(settings.web_output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     filename = f"digest-{digest_date.isoformat()}.html"
     filepath = output_dir / filename
-    filepath.write_text(web_html, encoding="utf-8")
+    _write_atomic(filepath, web_html)
+
+    url = f"/digests/{digest_date.isoformat()}"
+    date_iso = digest_date.isoformat()
+    entries = [e for e in _load_archive_entries(output_dir) if e["date_iso"] != date_iso]
+    entries.append({"date_iso": date_iso, "event_count": event_count, "url": url})
+    entries.sort(key=lambda e: e["date_iso"], reverse=True)
+    _write_atomic(output_dir / ARCHIVE_INDEX, orjson.dumps(entries))
 
     logger.info("Published web digest to %s", filepath)
-    return f"/digests/{digest_date.isoformat()}"
+    return url
+
 
+async def rebuild_archive(full: bool = False) -> None:
+    """Rebuild the archive index page from the archive index.
 
-async def rebuild_archive() -> None:
-    """Rebuild the archive index page from existing digest files."""
+    ``full`` rescans the digest files instead and rewrites the index from
+    them, keeping the event counts it already knew.
+    """
     output_dir = Path(settings.web_output_dir)
     if not output_dir.exists():
         return
 
-    digests = []
-    for f in sorted(output_dir.glob("digest-*.html"), reverse=True):
-        # Extract date from filename: digest-YYYY-MM-DD.html
-        date_str = f.stem.replace("digest-", "")
-        try:
-            d = date.fromisoformat(date_str)
-        except ValueError:
-            continue
-        digests.append({
-            "date": d.strftime("%B %d, %Y"),
-            "date_iso": d.isoformat(),
-            "event_count": "—",  # would need DB to get actual count
-            "url": f"/digests/{d.isoformat()}",
-        })
+    if full:
+        counts = {e["date_iso"]: e["event_count"] for e in _load_archive_entries(output_dir)}
+        entries = _scan_digest_files(output_dir)
+        for e in entries:
+            e["event_count"] = counts.get(e["date_iso"])
+        _write_atomic(output_dir / ARCHIVE_INDEX, orjson.dumps(entries))
+    else:
+        entries = _load_archive_entries(output_dir)
+
+    digests = [
+        {
+            "date": format_digest_date(date.fromisoformat(e["date_iso"])),
+            "date_iso": e["date_iso"],
+            "event_count": "—" if e["event_count"] is None else e["event_count"],
+            "url": e["url"],
+        }
+        for e in entries
+    ]
 
     archive_html = render_archive(digests)
-    (output_dir / "index.html").write_text(archive_html, encoding="utf-8")
+    _write_atomic(output_dir / "index.html", archive_html)
     logger.info("Rebuilt archive index with %d digests", len(digests))
@@ -6,10 +6,13 @@ import logging
 import re
 import uuid
 from datetime import date, datetime, timedelta, timezone
+from itertools import chain
 
 import anthropic
-from sqlalchemy import select, update
+from sqlalchemy import any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from ai_digest.config import settings
 from ai_digest.digest.renderer import render_email_digest, render_web_digest
@@ -22,14 +25,15 @@ from ai_digest.pipeline.summarizer import summarize_batch
 logger = logging.getLogger(__name__)
 
 _ALPHA_RE = re.compile(r"[A-Za-z]{2,}")
-_NOISE_TITLES = {
+_STAR_COUNT_RE = re.compile(r"[\d,\s]+")
+_NOISE_TITLES = frozenset({
     "community update",
     "community updates",
     "update",
     "updates",
     "announcement",
     "announcements",
-}
+})
 
 
 async def generate_digest(
@@ -65,6 +69,13 @@ async def generate_digest(
     # 1. Query events
     stmt = (
         select(UpdateEvent)
+        # Written by the summarizer but never read while building the digest
+        .options(
+            defer(UpdateEvent.evidence_snippets, raiseload=True),
+            defer(UpdateEvent.summary_medium, raiseload=True),
+            defer(UpdateEvent.rendered_event_html, raiseload=True),
+            defer(UpdateEvent.rendered_html_version, raiseload=True),
+        )
         .where(
             UpdateEvent.created_at >= cutoff_start,
             UpdateEvent.created_at <= cutoff_end,
@@ -97,11 +108,11 @@ async def generate_digest(
 
     # 4. Summarize (if LLM client available)
     if anthropic_client:
-        all_events = (
-            sections.top5 + sections.developer + sections.models
-            + sections.pricing + sections.incidents
-        )
-        await summarize_batch(all_events, anthropic_client, db)
+        to_summarize = list(chain(
+            sections.top5, sections.developer, sections.models,
+            sections.pricing, sections.incidents,
+        ))
+        await summarize_batch(to_summarize, anthropic_client, db)
 
     # 5. Generate overview
     overview = _generate_overview(sections)
@@ -122,21 +133,21 @@ async def generate_digest(
     db.add(digest)
 
     # Mark events as assigned to this digest (only those included in sections)
-    assigned_events = (
-        sections.top5
-        + sections.developer
-        + sections.models
-        + sections.pricing
-        + sections.incidents
-        + sections.radar
-        + sections.everything_else
-    )
-    event_ids = [e.event_id for e in assigned_events]
-    await db.execute(
-        update(UpdateEvent)
-        .where(UpdateEvent.event_id.in_(event_ids))
-        .values(digest_id=digest.digest_id)
-    )
+    event_ids = [
+        e.event_id for e in chain(
+            sections.top5, sections.developer, sections.models, sections.pricing,
+            sections.incidents, sections.radar, sections.everything_else,
+        )
+    ]
+    if event_ids:
+        # One uuid[] parameter instead of an IN list that grows with the digest
+        await db.execute(
+            update(UpdateEvent)
+            .where(UpdateEvent.event_id == any_(
+                bindparam("event_ids", event_ids, type_=ARRAY(UUID(as_uuid=True)))
+            ))
+            .values(digest_id=digest.digest_id, rendered_event_html=None)
+        )
 
     await db.commit()
 
@@ -165,7 +176,8 @@ def _generate_overview(sections: DigestSections) -> str:
 
 
 def _normalize_title(title: str) -> str:
-    return re.sub(r"\s+", " ", title.strip().lower())
+    # str.split() breaks on the same whitespace runs as \s+, without regex
+    return " ".join(title.lower().split())
 
 
 def _is_readable_title(title: str) -> bool:
@@ -180,24 +192,20 @@ def _is_readable_title(title: str) -> bool:
 
 
 def _looks_like_star_count(text: str) -> bool:
-    lower = text.lower()
-    if "stars today" in lower:
+    if "stars today" in text.lower():
         return True
     # mostly numbers and punctuation
-    return bool(re.fullmatch(r"[\d,\s]+", text.strip()))
+    return bool(_STAR_COUNT_RE.fullmatch(text.strip()))
 
 
 def _is_noise_event(event: UpdateEvent) -> bool:
     title = event.title or ""
-    norm = _normalize_title(title)
     if _looks_like_star_count(title):
         return True
-    if event.trust_tier >= 4:
-        if norm in _NOISE_TITLES:
-            return True
-        if not _is_readable_title(title):
-            return True
-    return False
+    # Generic or unreadable titles are only noise from low-trust sources
+    if event.trust_tier < 4:
+        return False
+    return _normalize_title(title) in _NOISE_TITLES or not _is_readable_title(title)
 
 
 def _dedupe_events(events: list[UpdateEvent]) -> list[UpdateEvent]:
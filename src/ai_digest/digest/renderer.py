@@ -6,8 +6,9 @@ import logging
 from datetime import date
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader
 
+from ai_digest.config import settings
 from ai_digest.digest.sections import DigestSections
 
 logger = logging.getLogger(__name__)
@@ -16,13 +17,41 @@ logger = logging.getLogger(__name__)
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 _TEMPLATES_DIR = _PROJECT_ROOT / "templates"
 
+# English month names (what %B gives under the C locale this app runs with)
+_MONTHS = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def format_digest_date(d: date) -> str:
+    """Long-form digest date, e.g. 'January 02, 2026' (same as ``%B %d, %Y``)."""
+    return f"{_MONTHS[d.month]} {d.day:02d}, {d.year}"
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    if not settings.template_cache_dir:
+        return None
+    cache_dir = Path(settings.template_cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+# Templates ship with the package and don't change at runtime, so skip the
+# per-render mtime check and look each one up once at import.
 _env = Environment(
     loader=FileSystemLoader(str(_TEMPLATES_DIR)),
     autoescape=True,
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=_bytecode_cache(),
 )
 
+_EMAIL_TMPL = _env.get_template("email/digest.html")
+_WEB_TMPL = _env.get_template("web/digest.html")
+_ARCHIVE_TMPL = _env.get_template("web/archive.html")
+
 
 def render_email_digest(
     digest_date: date,
@@ -30,9 +59,8 @@ def render_email_digest(
     sections: DigestSections,
 ) -> str:
     """Render the email HTML digest."""
-    template = _env.get_template("email/digest.html")
-    return template.render(
-        date=digest_date.strftime("%B %d, %Y"),
+    return _EMAIL_TMPL.render(
+        date=format_digest_date(digest_date),
         overview=overview,
         sections=sections,
     )
@@ -44,9 +72,8 @@ def render_web_digest(
     sections: DigestSections,
 ) -> str:
     """Render the web HTML digest page."""
-    template = _env.get_template("web/digest.html")
-    return template.render(
-        date=digest_date.strftime("%B %d, %Y"),
+    return _WEB_TMPL.render(
+        date=format_digest_date(digest_date),
         date_iso=digest_date.isoformat(),
         overview=overview,
         sections=sections,
@@ -60,5 +87,4 @@ def render_archive(
 
     ``digests`` is a list of dicts with keys: date, date_iso, event_count, url.
     """
-    template = _env.get_template("web/archive.html")
-    return template.render(digests=digests)
+    return _ARCHIVE_TMPL.render(digests=digests)
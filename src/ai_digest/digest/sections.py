@@ -16,8 +16,15 @@ from ai_digest.taxonomy import (
 
 logger = logging.getLogger(__name__)
 
+# Category sections in routing priority order, one bit each
+_ROUTED_SECTIONS = ("developer", "models", "pricing", "incidents")
+_CATEGORY_MASKS: dict[str, int] = {}
+for _bit, _cats in enumerate((SECTION_DEVELOPER, SECTION_MODELS, SECTION_PRICING, SECTION_INCIDENTS)):
+    for _cat in _cats:
+        _CATEGORY_MASKS[_cat] = _CATEGORY_MASKS.get(_cat, 0) | 1 << _bit
 
-@dataclass
+
+@dataclass(slots=True)
 class DigestSections:
     """Container for all 7 digest sections."""
 
@@ -31,29 +38,21 @@ class DigestSections:
 
     @property
     def total_count(self) -> int:
-        return (
-            len(self.top5)
-            + len(self.developer)
-            + len(self.models)
-            + len(self.pricing)
-            + len(self.incidents)
-            + len(self.radar)
-            + len(self.everything_else)
-        )
+        return sum(map(len, (
+            self.top5, self.developer, self.models, self.pricing,
+            self.incidents, self.radar, self.everything_else,
+        )))
 
     def to_dict(self) -> dict:
         """Serialise for storage in digests.sections JSONB column."""
-        def event_ids(events: list[UpdateEvent]) -> list[str]:
-            return [str(e.event_id) for e in events]
-
         return {
-            "top5": event_ids(self.top5),
-            "developer": event_ids(self.developer),
-            "models": event_ids(self.models),
-            "pricing": event_ids(self.pricing),
-            "incidents": event_ids(self.incidents),
-            "radar": event_ids(self.radar),
-            "everything_else": event_ids(self.everything_else),
+            "top5": [str(e.event_id) for e in self.top5],
+            "developer": [str(e.event_id) for e in self.developer],
+            "models": [str(e.event_id) for e in self.models],
+            "pricing": [str(e.event_id) for e in self.pricing],
+            "incidents": [str(e.event_id) for e in self.incidents],
+            "radar": [str(e.event_id) for e in self.radar],
+            "everything_else": [str(e.event_id) for e in self.everything_else],
         }
 
 
@@ -68,47 +67,45 @@ def allocate_sections(events: list[UpdateEvent]) -> DigestSections:
         return sections
 
     # Top 5: highest impact_score regardless of category
-    sections.top5 = events[:SECTION_QUOTAS["top5"]]
-    assigned_ids = {e.event_id for e in sections.top5}
-    remaining = [e for e in events if e.event_id not in assigned_ids]
-
-    # Route remaining events: community sources → radar first, then by category
-    for event in remaining:
-        cats = set(event.categories)
-
+    top5_n = min(SECTION_QUOTAS["top5"], len(events))
+    sections.top5 = events[:top5_n]
+    for e in sections.top5:
+        e.digest_section = "top5"
+    # Assignment flags by position in ``events`` (cheaper than hashing UUIDs)
+    assigned = bytearray(len(events))
+    assigned[:top5_n] = b"\x01" * top5_n
+
+    # Route remaining events: community sources → radar first, then by the
+    # first category section (in _ROUTED_SECTIONS order) that has room.
+    # digest_section is set as each event is placed.
+    routes = [
+        (name, getattr(sections, name), SECTION_QUOTAS[name], 1 << bit)
+        for bit, name in enumerate(_ROUTED_SECTIONS)
+    ]
+    radar, radar_quota = sections.radar, SECTION_QUOTAS["radar"]
+    masks = _CATEGORY_MASKS
+    for i in range(top5_n, len(events)):
+        event = events[i]
         # Community sources (trust_tier 4) always go to radar first
-        if event.trust_tier == 4 and len(sections.radar) < SECTION_QUOTAS["radar"]:
-            sections.radar.append(event)
-            assigned_ids.add(event.event_id)
-        elif cats & SECTION_DEVELOPER and len(sections.developer) < SECTION_QUOTAS["developer"]:
-            sections.developer.append(event)
-            assigned_ids.add(event.event_id)
-        elif cats & SECTION_MODELS and len(sections.models) < SECTION_QUOTAS["models"]:
-            sections.models.append(event)
-            assigned_ids.add(event.event_id)
-        elif cats & SECTION_PRICING and len(sections.pricing) < SECTION_QUOTAS["pricing"]:
-            sections.pricing.append(event)
-            assigned_ids.add(event.event_id)
-        elif cats & SECTION_INCIDENTS and len(sections.incidents) < SECTION_QUOTAS["incidents"]:
-            sections.incidents.append(event)
-            assigned_ids.add(event.event_id)
+        if event.trust_tier == 4 and len(radar) < radar_quota:
+            radar.append(event)
+            event.digest_section = "radar"
+            assigned[i] = 1
+            continue
+        mask = 0
+        for cat in event.categories:
+            mask |= masks.get(cat, 0)
+        if not mask:
+            continue
+        for name, bucket, quota, bit in routes:
+            if mask & bit and len(bucket) < quota:
+                bucket.append(event)
+                event.digest_section = name
+                assigned[i] = 1
+                break
 
     # Everything else: all remaining events not yet assigned
-    sections.everything_else = [e for e in events if e.event_id not in assigned_ids]
-
-    # Set digest_section on each event
-    for e in sections.top5:
-        e.digest_section = "top5"
-    for e in sections.developer:
-        e.digest_section = "developer"
-    for e in sections.models:
-        e.digest_section = "models"
-    for e in sections.pricing:
-        e.digest_section = "pricing"
-    for e in sections.incidents:
-        e.digest_section = "incidents"
-    for e in sections.radar:
-        e.digest_section = "radar"
+    sections.everything_else = [e for e, done in zip(events, assigned) if not done]
     for e in sections.everything_else:
         e.digest_section = "everything_else"
 
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
 
+from ai_digest.api.responses import ORJSONResponse
 from ai_digest.api.routes_digest import router as digest_router
 from ai_digest.api.routes_health import router as health_router
 from ai_digest.api.routes_sources import router as sources_router
 from ai_digest.api.routes_web import router as web_router
 from ai_digest.config import settings
-from ai_digest.scheduler.jobs import schedule_fetch_jobs, setup_scheduler
+from ai_digest.database import connection_reaper, warm_pool
+from ai_digest.scheduler.jobs import new_http_client, schedule_fetch_jobs, setup_scheduler
 
 logging.basicConfig(
     level=getattr(logging, settings.log_level.upper(), logging.INFO),
@@ -21,16 +27,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+# Pages link assets with a ?v=<content hash>, so a new file means a new URL
+STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Small JSON bodies are not worth compressing; digest pages shrink ~5-10x
+GZIP_MINIMUM_SIZE = 1000
+GZIP_LEVEL = 6
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache (versioned) assets for a year."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("cache-control", STATIC_CACHE_CONTROL)
+        return response
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup/shutdown lifecycle — start scheduler, schedule fetch jobs."""
+    """Startup/shutdown lifecycle — warm DB pool, start scheduler and jobs."""
+    try:
+        await warm_pool()
+    except Exception as exc:
+        logger.warning("Could not warm DB pool: %s", exc)
+    reaper = asyncio.create_task(connection_reaper())
+
+    # One HTTP client (HTTP/2, keep-alive pool) shared by every fetch job
+    http_client = new_http_client()
+
     scheduler = setup_scheduler()
     scheduler.start()
     logger.info("Scheduler started")
 
     try:
-        await schedule_fetch_jobs(scheduler)
+        await schedule_fetch_jobs(scheduler, http_client)
     except Exception as exc:
         logger.warning("Could not schedule fetch jobs (DB may not be ready): %s", exc)
 
@@ -39,14 +70,25 @@ async def lifespan(app: FastAPI):
     scheduler.shutdown(wait=False)
     logger.info("Scheduler shut down")
 
+    await http_client.aclose()
+
+    reaper.cancel()
+    with suppress(asyncio.CancelledError):
+        await reaper
+
 
 app = FastAPI(
     title="AI Daily Digest",
     description="Automated, citation-backed AI industry updates",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_LEVEL)
+
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
 app.include_router(web_router)
 app.include_router(health_router)
 app.include_router(digest_router)
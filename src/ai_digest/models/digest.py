@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Date, Index, Integer, Text
+from sqlalchemy import Date, Index, Integer, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -34,7 +34,7 @@ class Digest(Base):
     )
 
     __table_args__ = (
-        Index("idx_digests_date", "digest_date"),
+        Index("idx_digests_date", text("digest_date DESC")),
     )
 
     def __repr__(self) -> str:
@@ -5,18 +5,19 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, ForeignKey, Index, LargeBinary, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ai_digest.database import Base
+from ai_digest.ids import uuid7
 
 
 class RawItem(Base):
     __tablename__ = "raw_items"
 
     raw_item_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     source_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("sources.source_id"), nullable=False
@@ -26,7 +27,7 @@ class RawItem(Base):
     title: Mapped[str | None] = mapped_column(Text, nullable=True)
     content_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     content_html: Mapped[str | None] = mapped_column(Text, nullable=True)
-    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    content_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     published_at: Mapped[datetime | None] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
     )
@@ -40,8 +41,15 @@ class RawItem(Base):
     __table_args__ = (
         Index("idx_raw_items_source", "source_id", "fetched_at"),
         Index("idx_raw_items_hash", "content_hash"),
-        Index("idx_raw_items_url", "url"),
-        Index("idx_raw_items_published", "published_at"),
+        Index("idx_raw_items_url_hash", "url", postgresql_using="hash"),
+        Index(
+            "idx_raw_items_published_brin", "published_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 64},
+        ),
+        Index(
+            "idx_raw_items_metadata_gin", "metadata",
+            postgresql_using="gin", postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
         UniqueConstraint("source_id", "external_id", name="uq_raw_items_source_ext"),
     )
 
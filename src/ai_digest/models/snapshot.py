@@ -5,28 +5,32 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, LargeBinary, Text
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ai_digest.database import Base
+from ai_digest.ids import uuid7
 
 
 class Snapshot(Base):
     __tablename__ = "snapshots"
 
     snapshot_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     source_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("sources.source_id"), nullable=False
     )
     s3_key: Mapped[str] = mapped_column(Text, nullable=False)
-    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    content_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     fetched_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), nullable=False, server_default="now()"
     )
+    # Full page text; only on snapshots stored before line_hashes existed
     diff_from_prev: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 8-byte digest per line of the page text, in page order
+    line_hashes: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     has_changes: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     __table_args__ = (
@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Index, Integer, SmallInteger, String, Text
+from sqlalchemy import Boolean, Index, Integer, SmallInteger, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -42,8 +42,16 @@ class Source(Base):
 
     __table_args__ = (
         Index("idx_sources_company", "company_slug"),
-        Index("idx_sources_enabled", "enabled", "health_status"),
-        Index("idx_sources_next_fetch", "enabled", "last_fetched_at", "poll_frequency_min"),
+        Index("idx_sources_enabled", "health_status", postgresql_where=text("enabled")),
+        Index(
+            "idx_sources_next_fetch", "last_fetched_at",
+            postgresql_include=["source_id", "poll_frequency_min", "fetch_method"],
+            postgresql_where=text("enabled"),
+        ),
+        Index(
+            "idx_sources_parse_rules_gin", "parse_rules",
+            postgresql_using="gin", postgresql_ops={"parse_rules": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -4,19 +4,24 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Float, ForeignKey, Index, SmallInteger, String, Text
+from sqlalchemy import Boolean, Float, ForeignKey, Index, SmallInteger, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TIMESTAMP, UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ai_digest.database import Base
+from ai_digest.ids import uuid7
+
+if TYPE_CHECKING:
+    from ai_digest.models.raw_item import RawItem
 
 
 class UpdateEvent(Base):
     __tablename__ = "update_events"
 
     event_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     cluster_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("clusters.cluster_id"), nullable=True
@@ -53,20 +58,40 @@ class UpdateEvent(Base):
     published_at: Mapped[datetime | None] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
     )
+    # Part of the primary key because the table is range-partitioned on it
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=False, server_default="now()"
+        TIMESTAMP(timezone=True), primary_key=True, server_default="now()"
     )
     digest_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("digests.digest_id"), nullable=True
     )
     digest_section: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    # Event card HTML for the web view, rendered lazily and reset on digest build
+    rendered_event_html: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Card markup version the cached HTML was rendered with; a mismatch is a miss
+    rendered_html_version: Mapped[str | None] = mapped_column(String(16), nullable=True)
+
+    # Only loaded on request (e.g. selectinload); a stray lazy load raises
+    raw_item: Mapped[RawItem] = relationship(lazy="raise")
 
     __table_args__ = (
-        Index("idx_events_company", "company_slug", "created_at"),
+        Index("idx_events_company", "company_slug", text("created_at DESC")),
         Index("idx_events_score", "impact_score"),
-        Index("idx_events_created", "created_at"),
-        Index("idx_events_digest", "digest_id"),
+        Index(
+            "idx_events_created_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 64},
+        ),
+        Index("idx_events_digest_impact", "digest_id", text("impact_score DESC")),
+        Index(
+            "idx_events_undigested", "created_at",
+            postgresql_where=text("digest_id IS NULL"),
+        ),
         Index("idx_events_severity", "severity", "created_at"),
+        Index(
+            "idx_events_what_changed_gin", "what_changed",
+            postgresql_using="gin", postgresql_ops={"what_changed": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
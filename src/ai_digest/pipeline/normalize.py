@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import logging
 import re
-import uuid
 from datetime import datetime, timezone
 
 from ai_digest.connectors.base import RawItemData
+from ai_digest.ids import uuid7
 from ai_digest.models.raw_item import RawItem
 from ai_digest.models.source import Source
 from ai_digest.models.update_event import UpdateEvent
@@ -17,11 +17,12 @@ logger = logging.getLogger(__name__)
 _TAG_RE = re.compile(r"<[^>]+>")
 _ALPHA_RE = re.compile(r"[A-Za-z]{2,}")
 _REPO_RE = re.compile(r"([\w.-]+)\s*/\s*([\w.-]+)")
+_WS_RE = re.compile(r"\s+")
 
 
 def _strip_markup(text: str) -> str:
     clean = _TAG_RE.sub(" ", text)
-    return re.sub(r"\s+", " ", clean).strip()
+    return _WS_RE.sub(" ", clean).strip()
 
 
 def _is_readable(text: str, min_words: int = 3) -> bool:
@@ -63,7 +64,7 @@ def normalize_item(
                 title = f"{source.company_name} update"
 
     return UpdateEvent(
-        event_id=uuid.uuid4(),
+        event_id=uuid7(),
         source_id=source.source_id,
         raw_item_id=raw_item.raw_item_id,
         company_slug=source.company_slug,
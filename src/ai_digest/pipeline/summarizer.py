@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 _TAG_RE = re.compile(r"<[^>]+>")
 _ALPHA_RE = re.compile(r"[A-Za-z]{2,}")
+_WS_RE = re.compile(r"\s+")
 
 SYSTEM_PROMPT = """\
 You are a factual AI news summarizer. Your job is to produce structured
@@ -170,7 +171,7 @@ async def summarize_batch(
 
 def _clean_content(text: str) -> str:
     clean = _TAG_RE.sub(" ", text)
-    return re.sub(r"\s+", " ", clean).strip()
+    return _WS_RE.sub(" ", clean).strip()
 
 
 def _is_readable(text: str, min_words: int = 3) -> bool:
@@ -181,6 +182,28 @@ def _is_readable(text: str, min_words: int = 3) -> bool:
     return alpha_words / len(words) > 0.3
 
 
+def normalize_what_changed(items: Any) -> list[dict[str, str]]:
+    """Coerce ``what_changed`` to a list of ``{"fact", "citation_url"}`` dicts.
+
+    The LLM (and older rows) may yield bare strings or dicts with missing
+    keys; readers can rely on the normalized shape.  Blank facts are dropped.
+    """
+    if not isinstance(items, list):
+        return []
+    normalized = []
+    for item in items:
+        if isinstance(item, dict):
+            fact = str(item.get("fact") or "")
+            cite = str(item.get("citation_url") or "")
+        elif isinstance(item, str):
+            fact, cite = item, ""
+        else:
+            continue
+        if fact.strip():
+            normalized.append({"fact": fact, "citation_url": cite})
+    return normalized
+
+
 def _build_content(event: UpdateEvent, raw_content: str | None = None) -> str:
     """Build the source content string for the LLM prompt."""
     parts = []
@@ -191,10 +214,7 @@ def _build_content(event: UpdateEvent, raw_content: str | None = None) -> str:
         if clean and _is_readable(clean, min_words=1):
             parts.append(f"Content: {clean}")
     # Include any existing structured fields as extra context.
-    if event.what_changed:
-        for item in event.what_changed:
-            if isinstance(item, dict):
-                parts.append(item.get("fact", ""))
+    parts.extend(item["fact"] for item in normalize_what_changed(event.what_changed))
     if event.why_it_matters:
         parts.append(event.why_it_matters)
     return "\n".join(parts) if parts else event.title or ""
@@ -229,7 +249,7 @@ def _apply_llm_output(event: UpdateEvent, data: dict[str, Any]) -> None:
     if title := data.get("title"):
         event.title = title[:200]
 
-    if what_changed := data.get("what_changed"):
+    if what_changed := normalize_what_changed(data.get("what_changed")):
         event.what_changed = what_changed
 
     if why := data.get("why_it_matters"):
@@ -262,12 +282,7 @@ def _apply_llm_output(event: UpdateEvent, data: dict[str, Any]) -> None:
         event.severity = severity
 
     # Generate short and medium summaries from the structured data
-    what_facts = []
-    if event.what_changed and isinstance(event.what_changed, list):
-        what_facts = [
-            item.get("fact", "") if isinstance(item, dict) else str(item)
-            for item in event.what_changed
-        ]
+    what_facts = [item["fact"] for item in normalize_what_changed(event.what_changed)]
 
     event.summary_short = f"{event.title}. {event.why_it_matters or ''}"[:300]
     event.summary_medium = (
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import logging
-import uuid
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import anthropic
 import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy import select, update
+from sqlalchemy import select, text, update
 
 from ai_digest.config import settings
 from ai_digest.connectors.base import RawItemData
@@ -18,10 +17,11 @@ from ai_digest.database import async_session_factory
 from ai_digest.delivery.email_sender import send_digest_email
 from ai_digest.delivery.web_publisher import publish_web_digest, rebuild_archive
 from ai_digest.digest.generator import generate_digest
+from ai_digest.ids import uuid7
 from ai_digest.models.raw_item import RawItem
 from ai_digest.models.source import Source
 from ai_digest.models.update_event import UpdateEvent
-from ai_digest.pipeline.dedupe import hard_dedupe, soft_dedupe_and_cluster
+from ai_digest.pipeline.dedupe import existing_content_hashes, soft_dedupe_and_cluster
 from ai_digest.pipeline.entity_resolution import resolve_entities
 from ai_digest.pipeline.normalize import normalize_batch
 from ai_digest.pipeline.ranking import rank_events
@@ -29,9 +29,40 @@ from ai_digest.pipeline.summarizer import summarize_batch
 
 logger = logging.getLogger(__name__)
 
+# Sources cluster on a few hosts (github.com, hn.algolia.com, ...), so a
+# shared client keeps those connections open and multiplexes them over HTTP/2
+HTTP_MAX_CONNECTIONS = 100
+HTTP_KEEPALIVE_CONNECTIONS = 50
+HTTP_CONNECT_RETRIES = 2
+
+
+def new_http_client() -> httpx.AsyncClient:
+    """HTTP client used by the fetch jobs (HTTP/2, keep-alive pool)."""
+    # With an explicit transport, http2/limits must be set on the transport
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS,
+        ),
+        retries=HTTP_CONNECT_RETRIES,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        follow_redirects=True,
+        headers={"User-Agent": "AI-Digest-Bot/1.0"},
+    )
+
 
-async def fetch_source_job(source_id: str) -> None:
-    """Fetch new items from a single source and persist as RawItems."""
+async def fetch_source_job(
+    source_id: str, http_client: httpx.AsyncClient | None = None
+) -> None:
+    """Fetch new items from a single source and persist as RawItems.
+
+    Pass ``http_client`` to share one connection pool across many sources;
+    otherwise a client is opened for this fetch only.
+    """
     async with async_session_factory() as db:
         result = await db.execute(
             select(Source).where(Source.source_id == source_id)
@@ -46,24 +77,27 @@ async def fetch_source_job(source_id: str) -> None:
             logger.error("No connector for source %s: %s", source.source_name, e)
             return
 
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers={"User-Agent": "AI-Digest-Bot/1.0"},
-        ) as http_client:
-            try:
+        try:
+            if http_client is None:
+                async with new_http_client() as client:
+                    items = await connector.fetch(source, client, db)
+            else:
                 items = await connector.fetch(source, http_client, db)
-            except Exception as exc:
-                logger.error("Fetch failed for %s: %s", source.source_name, exc)
-                return
+        except Exception as exc:
+            logger.error("Fetch failed for %s: %s", source.source_name, exc)
+            return
 
+        # Hard dedup: one lookup for the whole batch; ``seen`` also drops
+        # repeats within this fetch
+        seen = await existing_content_hashes([i.content_hash for i in items], db)
         saved = 0
         for item_data in items:
-            # Hard dedup check
-            if await hard_dedupe(item_data.content_hash, db):
+            if item_data.content_hash in seen:
                 continue
+            seen.add(item_data.content_hash)
 
             raw_item = RawItem(
-                raw_item_id=uuid.uuid4(),
+                raw_item_id=uuid7(),
                 source_id=source.source_id,
                 external_id=item_data.external_id,
                 url=item_data.url,
@@ -133,7 +167,7 @@ async def pipeline_job() -> None:
             # Build (RawItemData, RawItem) pairs for normalize
             pairs: list[tuple[RawItemData, RawItem]] = []
             for ri in raw_items:
-                rid = RawItemData(
+                rid = RawItemData.model_construct(
                     external_id=ri.external_id,
                     url=ri.url,
                     title=ri.title,
@@ -194,7 +228,7 @@ async def digest_job() -> None:
         # Publish web
         web_html = getattr(digest, "_web_html", None)
         if web_html:
-            web_url = await publish_web_digest(today, web_html)
+            web_url = await publish_web_digest(today, web_html, digest.event_count)
             digest.web_url = web_url
             if digest.delivery_channels:
                 digest.delivery_channels.append("web")
@@ -209,6 +243,27 @@ async def digest_job() -> None:
         logger.info("Digest for %s generated and delivered", today)
 
 
+async def partition_maintenance_job() -> None:
+    """Make sure update_events has partitions for this month and the next.
+
+    Partitions are created by the ``ensure_update_events_partition`` SQL
+    function (migrations 006/015); it is a no-op if one already exists, and
+    moves rows that landed in the DEFAULT partition into the new one.
+    """
+    this_month = date.today().replace(day=1)
+    next_month = (this_month + timedelta(days=32)).replace(day=1)
+
+    async with async_session_factory() as db:
+        for month in (this_month, next_month):
+            await db.execute(
+                text("SELECT ensure_update_events_partition(:month)"),
+                {"month": month},
+            )
+        await db.commit()
+
+    logger.info("Ensured update_events partitions through %s", next_month.strftime("%Y-%m"))
+
+
 def setup_scheduler() -> AsyncIOScheduler:
     """Create and configure the APScheduler instance.
 
@@ -238,13 +293,28 @@ def setup_scheduler() -> AsyncIOScheduler:
         replace_existing=True,
     )
 
+    # Partition maintenance: daily, plus once at startup
+    scheduler.add_job(
+        partition_maintenance_job,
+        "cron",
+        hour=0,
+        minute=5,
+        id="partitions_daily",
+        name="update_events partition maintenance",
+        replace_existing=True,
+        next_run_time=datetime.now(timezone.utc),
+    )
+
     return scheduler
 
 
-async def schedule_fetch_jobs(scheduler: AsyncIOScheduler) -> None:
+async def schedule_fetch_jobs(
+    scheduler: AsyncIOScheduler, http_client: httpx.AsyncClient | None = None
+) -> None:
     """Add per-source fetch jobs based on the source registry.
 
     Should be called after the scheduler is started and DB is available.
+    Passing ``http_client`` shares one connection pool across every job.
     """
     async with async_session_factory() as db:
         result = await db.execute(
@@ -258,7 +328,7 @@ async def schedule_fetch_jobs(scheduler: AsyncIOScheduler) -> None:
             fetch_source_job,
             "interval",
             minutes=source.poll_frequency_min,
-            args=[str(source.source_id)],
+            args=[str(source.source_id), http_client],
             id=job_id,
             name=f"Fetch {source.source_name}",
             replace_existing=True,
@@ -5,9 +5,11 @@ from __future__ import annotations
 import csv
 import logging
 import uuid
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_digest.models.source import Source
@@ -16,6 +18,84 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CSV = Path(__file__).resolve().parent.parent.parent / "data" / "sources_seed.csv"
 
+# New rows at or above this count are loaded with COPY; smaller batches use a
+# single multi-row INSERT (COPY setup costs more than it saves for a handful).
+COPY_THRESHOLD = 500
+COPY_BATCH_SIZE = 5000
+
+_COPY_COLUMNS = (
+    "source_id",
+    "company_slug",
+    "company_name",
+    "product_line",
+    "source_name",
+    "source_url",
+    "fetch_method",
+    "poll_frequency_min",
+    "trust_tier",
+    "priority",
+)
+
+
+# CSV header names, in the order _row_to_values unpacks them
+_CSV_FIELDS = (
+    "company_slug",
+    "company_name",
+    "product_line",
+    "source_name",
+    "source_url",
+    "fetch_method",
+    "poll_freq_min",
+    "trust_tier",
+    "priority",
+)
+
+
+def _row_to_values(fields: tuple[str, ...]) -> dict:
+    (
+        company_slug, company_name, product_line, source_name, source_url,
+        fetch_method, poll_freq_min, trust_tier, priority,
+    ) = (f.strip() for f in fields)
+    return {
+        "company_slug": company_slug or "community",
+        "company_name": company_name or "Community",
+        "product_line": product_line or None,
+        "source_name": source_name,
+        "source_url": source_url,
+        "fetch_method": fetch_method,
+        "poll_frequency_min": int(poll_freq_min or 60),
+        "trust_tier": int(trust_tier or 1),
+        "priority": priority or "normal",
+    }
+
+
+def _read_seed_csv(csv_path: Path) -> dict[str, dict]:
+    """Parse the seed CSV into column values keyed by source URL.
+
+    Uses the plain C ``csv.reader`` and picks columns by header position,
+    so no per-row dict is built for the raw record.  Optional trailing
+    columns may be missing from the header; they read as empty.
+    """
+    # Keyed by URL so a repeated URL in the CSV behaves like an update (last wins)
+    values_by_url: dict[str, dict] = {}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return values_by_url
+        width = len(header)
+        # Missing optional columns point at an appended empty cell
+        positions = [header.index(name) if name in header else width for name in _CSV_FIELDS]
+        pick = itemgetter(*positions)
+        url_pos = header.index("source_url")
+        for row in reader:
+            if len(row) <= url_pos or not row[url_pos].strip():
+                continue
+            row.extend([""] * (width + 1 - len(row)))
+            values = _row_to_values(pick(row))
+            values_by_url[values["source_url"]] = values
+    return values_by_url
+
 
 async def seed_sources(
     db: AsyncSession,
@@ -23,56 +103,71 @@ async def seed_sources(
 ) -> int:
     """Read sources from CSV and upsert into the database.
 
+    Existing sources (matched by URL) are updated with one executemany
+    UPDATE; new sources are inserted in bulk via COPY or a multi-row INSERT.
+
     Returns the number of sources created or updated.
     """
     if not csv_path.exists():
         logger.error("Seed CSV not found: %s", csv_path)
         return 0
 
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    count = 0
-    for row in rows:
-        source_url = row["source_url"].strip()
-        if not source_url:
-            continue
-
-        # Check if source already exists by URL
-        result = await db.execute(
-            select(Source).where(Source.source_url == source_url)
+    values_by_url = _read_seed_csv(csv_path)
+    if not values_by_url:
+        return 0
+
+    result = await db.execute(
+        select(Source.source_url, Source.source_id).where(
+            Source.source_url.in_(values_by_url)
         )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update existing source
-            existing.company_slug = row["company_slug"].strip() or "community"
-            existing.company_name = row["company_name"].strip() or "Community"
-            existing.product_line = row.get("product_line", "").strip() or None
-            existing.source_name = row["source_name"].strip()
-            existing.fetch_method = row["fetch_method"].strip()
-            existing.poll_frequency_min = int(row.get("poll_freq_min", 60))
-            existing.trust_tier = int(row.get("trust_tier", 1))
-            existing.priority = row.get("priority", "normal").strip()
-            count += 1
-        else:
-            # Create new source
-            source = Source(
-                source_id=uuid.uuid4(),
-                company_slug=row["company_slug"].strip() or "community",
-                company_name=row["company_name"].strip() or "Community",
-                product_line=row.get("product_line", "").strip() or None,
-                source_name=row["source_name"].strip(),
-                source_url=source_url,
-                fetch_method=row["fetch_method"].strip(),
-                poll_frequency_min=int(row.get("poll_freq_min", 60)),
-                trust_tier=int(row.get("trust_tier", 1)),
-                priority=row.get("priority", "normal").strip(),
-            )
-            db.add(source)
-            count += 1
+    )
+    existing = {row.source_url: row.source_id for row in result}
+
+    # Set explicitly: the bulk UPDATE has no onupdate to bump it, and the
+    # sources page ETag relies on max(updated_at)
+    now = datetime.now(timezone.utc)
+    updates = [
+        {"source_id": existing[url], **values, "updated_at": now}
+        for url, values in values_by_url.items()
+        if url in existing
+    ]
+    new_rows = [
+        {"source_id": uuid.uuid4(), **values}
+        for url, values in values_by_url.items()
+        if url not in existing
+    ]
+
+    if updates:
+        # ORM bulk UPDATE by primary key — a single executemany round trip
+        await db.execute(update(Source), updates)
+
+    if len(new_rows) >= COPY_THRESHOLD and db.bind.dialect.driver == "asyncpg":
+        await _copy_sources(db, new_rows)
+    elif new_rows:
+        await db.execute(insert(Source).values(new_rows))
 
     await db.commit()
-    logger.info("Seeded %d sources from %s", count, csv_path)
+    count = len(updates) + len(new_rows)
+    logger.info(
+        "Seeded %d sources from %s (%d new, %d updated)",
+        count, csv_path, len(new_rows), len(updates),
+    )
     return count
+
+
+async def _copy_sources(db: AsyncSession, rows: list[dict]) -> None:
+    """Stream new source rows into Postgres with ``COPY ... FROM STDIN``.
+
+    Columns not listed in ``_COPY_COLUMNS`` fall back to their server defaults.
+    """
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    driver_conn = raw.driver_connection
+
+    records = [tuple(row[col] for col in _COPY_COLUMNS) for row in rows]
+    for start in range(0, len(records), COPY_BATCH_SIZE):
+        await driver_conn.copy_records_to_table(
+            Source.__tablename__,
+            records=records[start:start + COPY_BATCH_SIZE],
+            columns=list(_COPY_COLUMNS),
+        )
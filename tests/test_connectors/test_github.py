@@ -36,7 +36,7 @@ async def test_github_connector_parses_releases(sample_source):
 
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = releases_json
+    mock_response.content = json.dumps(releases_json).encode()
 
     mock_client = AsyncMock()
     mock_client.get = AsyncMock(return_value=mock_response)
@@ -48,3 +48,27 @@ async def test_github_connector_parses_releases(sample_source):
     assert items[0].title == "v2.0.0 — Major Release"
     assert items[0].external_id == "12345"
     assert items[0].metadata.get("tag_name") == "v2.0.0"
+
+
+@pytest.mark.asyncio
+async def test_github_connector_uses_stored_etag(sample_source):
+    connector = GitHubReleasesConnector()
+    sample_source.source_url = "https://github.com/testco/test-sdk/releases"
+    sample_source.parse_rules = {"etag": '"v1"'}
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b"[]"
+    mock_response.headers = {"etag": '"v2"'}
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    await connector.fetch(sample_source, mock_client, AsyncMock())
+
+    assert mock_client.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert sample_source.parse_rules == {"etag": '"v2"'}
+
+    mock_response.status_code = 304
+    items = await connector.fetch(sample_source, mock_client, AsyncMock())
+    assert items == []
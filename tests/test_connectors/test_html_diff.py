@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from ai_digest.connectors.html_diff import HTMLDiffConnector
+from ai_digest.connectors.html_diff import HTMLDiffConnector, _line_hashes
 
 
 @pytest.mark.asyncio
@@ -17,13 +17,14 @@ async def test_html_diff_first_snapshot_returns_empty(sample_source):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.text = "<html><body><p>Initial content</p></body></html>"
+    mock_response.content = mock_response.text.encode()
 
     mock_client = AsyncMock()
     mock_client.get = AsyncMock(return_value=mock_response)
 
     # Mock DB: no previous snapshot
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
+    mock_result.first.return_value = None
     mock_db = AsyncMock()
     mock_db.execute = AsyncMock(return_value=mock_result)
     mock_db.add = MagicMock()
@@ -48,3 +49,67 @@ async def test_html_diff_handles_http_error(sample_source):
 
     items = await connector.fetch(sample_source, mock_client, mock_db)
     assert items == []
+
+
+@pytest.mark.asyncio
+async def test_html_diff_returns_only_new_lines(sample_source):
+    """Reordered lines are not changes; only lines absent before are."""
+    connector = HTMLDiffConnector()
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.text = (
+        "<html><body><p>Second existing entry</p><p>First existing entry</p>"
+        "<p>Brand new model release today</p></body></html>"
+    )
+    mock_response.content = mock_response.text.encode()
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    prev_snapshot = MagicMock()
+    prev_snapshot.content_hash = b"\x00" * 32
+    mock_result = MagicMock()
+    mock_result.first.return_value = prev_snapshot
+    # Snapshot from before line hashes: diffed against its stored text
+    mock_result.one.return_value = MagicMock(
+        line_hashes=None, diff_from_prev="First existing entry\nSecond existing entry"
+    )
+    mock_db = AsyncMock()
+    mock_db.execute = AsyncMock(return_value=mock_result)
+    mock_db.add = MagicMock()
+
+    sample_source.fetch_method = "html_diff"
+    items = await connector.fetch(sample_source, mock_client, mock_db)
+
+    assert [item.content_text for item in items] == ["Brand new model release today"]
+
+
+@pytest.mark.asyncio
+async def test_html_diff_skips_snapshot_when_text_unchanged(sample_source):
+    """Markup-only changes must not store another snapshot."""
+    connector = HTMLDiffConnector()
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.text = '<html><body><p data-nonce="b7">Same text</p></body></html>'
+    mock_response.content = mock_response.text.encode()
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    prev_snapshot = MagicMock()
+    prev_snapshot.content_hash = b"\x00" * 32
+    mock_result = MagicMock()
+    mock_result.first.return_value = prev_snapshot
+    mock_result.one.return_value = MagicMock(
+        line_hashes=_line_hashes("Same text"), diff_from_prev=None
+    )
+    mock_db = AsyncMock()
+    mock_db.execute = AsyncMock(return_value=mock_result)
+    mock_db.add = MagicMock()
+
+    items = await connector.fetch(sample_source, mock_client, mock_db)
+
+    assert items == []
+    mock_db.add.assert_not_called()
@@ -58,6 +58,18 @@ def test_allocate_developer_section():
     assert len(sections.developer) == 2
 
 
+def test_allocate_falls_through_full_section():
+    events = [_make_event(f"Top {i}", 0.9 - i * 0.05) for i in range(5)]
+    events += [_make_event(f"SDK {i}", 0.5, ["SDK releases/updates"]) for i in range(8)]
+    events.append(
+        _make_event("SDK + model", 0.4, ["SDK releases/updates", "New foundation model release"])
+    )
+    sections = allocate_sections(events)
+    assert len(sections.developer) == 8
+    assert [e.title for e in sections.models] == ["SDK + model"]
+    assert sections.everything_else == []
+
+
 def test_allocate_radar():
     events = [_make_event(f"Top {i}", 0.9 - i * 0.05) for i in range(5)]
     events.append(_make_event("Community tool", 0.3, trust_tier=4))
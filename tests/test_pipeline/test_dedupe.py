@@ -4,34 +4,79 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 import pytest
 
 from ai_digest.models.update_event import UpdateEvent
-from ai_digest.pipeline.dedupe import _title_similarity
+from ai_digest.pipeline.dedupe import soft_dedupe_and_cluster
 
 
-def test_title_similarity_identical():
-    assert _title_similarity("Hello World", "Hello World") == 1.0
+def _event(title: str, trust_tier: int) -> UpdateEvent:
+    return UpdateEvent(
+        event_id=uuid.uuid4(),
+        company_slug="openai",
+        title=title,
+        trust_tier=trust_tier,
+        published_at=datetime.now(timezone.utc),
+    )
 
 
-def test_title_similarity_case_insensitive():
-    assert _title_similarity("Hello World", "hello world") == 1.0
+@pytest.mark.asyncio
+async def test_soft_dedupe_clusters_similar_titles():
+    events = [
+        _event("OpenAI releases GPT-5 model", 2),
+        _event("Anthropic launches Claude 4", 1),
+        _event("OpenAI releases the GPT-5 model", 1),
+    ]
+    db = MagicMock()
 
+    await soft_dedupe_and_cluster(events, db)
 
-def test_title_similarity_different():
-    sim = _title_similarity("OpenAI releases GPT-5", "Anthropic launches Claude 4")
-    assert sim < 0.5
+    db.add.assert_called_once()
+    cluster = db.add.call_args.args[0]
+    assert cluster.event_count == 2
+    assert cluster.canonical_title == "OpenAI releases the GPT-5 model"
+    assert events[0].cluster_id == events[2].cluster_id == cluster.cluster_id
+    assert events[1].cluster_id is None
 
 
-def test_title_similarity_very_similar():
-    sim = _title_similarity(
-        "OpenAI releases GPT-5 model",
-        "OpenAI releases GPT-5 foundation model",
-    )
-    assert sim > 0.8
+@pytest.mark.asyncio
+async def test_soft_dedupe_ignores_case_and_surrounding_space():
+    events = [_event("Hello World", 1), _event("  hello world ", 1)]
+    db = MagicMock()
+
+    await soft_dedupe_and_cluster(events, db)
+
+    db.add.assert_called_once()
+    assert events[0].cluster_id == events[1].cluster_id is not None
+
+
+@pytest.mark.asyncio
+async def test_soft_dedupe_leaves_different_and_empty_titles():
+    events = [
+        _event("OpenAI releases GPT-5", 1),
+        _event("Anthropic launches Claude 4", 1),
+        _event("", 1),
+        _event("", 1),
+    ]
+    db = MagicMock()
+
+    await soft_dedupe_and_cluster(events, db)
+
+    db.add.assert_not_called()
+    assert all(e.cluster_id is None for e in events)
+
+
+@pytest.mark.asyncio
+async def test_soft_dedupe_threshold_boundary():
+    # Indel ratio 0.83: related, but below SIMILARITY_THRESHOLD
+    events = [
+        _event("OpenAI releases GPT-5 model", 1),
+        _event("OpenAI releases GPT-5 foundation model", 1),
+    ]
+    db = MagicMock()
 
+    await soft_dedupe_and_cluster(events, db)
 
-def test_title_similarity_empty():
-    assert _title_similarity("", "hello") == 0.0
-    assert _title_similarity("hello", "") == 0.0
+    db.add.assert_not_called()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import uuid
 
 import pytest
@@ -39,7 +40,7 @@ def test_normalize_item_sets_confidence(sample_source):
         raw_item_id=uuid.uuid4(),
         source_id=sample_source.source_id,
         url="https://example.com",
-        content_hash="abc",
+        content_hash=b"abc",
     )
     event = normalize_item(raw_data, raw_item, sample_source)
     assert event.confidence == "unverified"
@@ -55,7 +56,7 @@ def test_normalize_item_fallback_title(sample_source):
         raw_item_id=uuid.uuid4(),
         source_id=sample_source.source_id,
         url="https://example.com",
-        content_hash="abc",
+        content_hash=b"abc",
     )
     event = normalize_item(raw_data, raw_item, sample_source)
     assert event.title == "Some content here about a change"
@@ -71,7 +72,17 @@ def test_normalize_item_numeric_title_uses_company_fallback(sample_source):
         raw_item_id=uuid.uuid4(),
         source_id=sample_source.source_id,
         url="https://example.com",
-        content_hash="abc",
+        content_hash=b"abc",
     )
     event = normalize_item(raw_data, raw_item, sample_source)
     assert event.title == "TestCo update"
+
+
+def test_raw_item_content_hash():
+    item = RawItemData(url="https://example.com/a", title="Title", content_text="Body ü")
+    expected = hashlib.sha256("https://example.com/aBody ü".encode()).digest()
+    assert item.content_hash == expected
+    assert item.content_hash is item.content_hash  # computed once
+
+    title_only = RawItemData(url="https://example.com/a", title="Title")
+    assert title_only.content_hash == hashlib.sha256(b"https://example.com/aTitle").digest()
@@ -8,7 +8,11 @@ from datetime import datetime, timezone
 import pytest
 
 from ai_digest.models.update_event import UpdateEvent
-from ai_digest.pipeline.summarizer import _parse_llm_json, _set_fallback_summary
+from ai_digest.pipeline.summarizer import (
+    _parse_llm_json,
+    _set_fallback_summary,
+    normalize_what_changed,
+)
 
 
 def _make_event(**kwargs) -> UpdateEvent:
@@ -64,3 +68,19 @@ def test_fallback_summary():
     _set_fallback_summary(event)
     assert event.summary_short == "Something happened with the API"
     assert event.summary_medium == "Something happened with the API"
+
+
+def test_normalize_what_changed():
+    items = [
+        {"fact": "Added streaming", "citation_url": "https://example.com/a"},
+        "Bare string fact",
+        {"fact": "No citation"},
+        {"fact": "  "},
+        None,
+    ]
+    assert normalize_what_changed(items) == [
+        {"fact": "Added streaming", "citation_url": "https://example.com/a"},
+        {"fact": "Bare string fact", "citation_url": ""},
+        {"fact": "No citation", "citation_url": ""},
+    ]
+    assert normalize_what_changed(None) == []